@@ -13,13 +13,15 @@
 # All configuration values have a default; values that are commented out
 # serve to show the default.
 from datetime import datetime
+from importlib import metadata
 import os
 from pathlib import Path
 import sys
 
-from pkg_resources import DistributionNotFound, get_distribution
+# Import all lazily loaded subpackages of `probnum` eagerly during documentation builds
+os.environ.setdefault("SPHINX_BUILD", "1")
 
-import probnum
+import probnum  # pylint: disable=wrong-import-position
 
 # If extensions (or modules to document with autodoc) are in another directory,
 # add these directories to sys.path here. If the directory is relative to the
@@ -93,13 +95,11 @@ author = "ProbNum Authors"
 
 try:
     # The full version, including alpha/beta/rc tags.
-    release = get_distribution(project).version
+    release = metadata.version(project)
     # The short X.Y.Z version.
     version = ".".join(release.split(".")[:2])
-except DistributionNotFound:
+except metadata.PackageNotFoundError:
     version = ""
-finally:
-    del get_distribution, DistributionNotFound
 
 # The language for content autogenerated by Sphinx. Refer to documentation
 # for a list of supported languages.
@@ -132,7 +132,9 @@ nbsphinx_allow_errors = True
 
 # Whether to execute notebooks before conversion or not.
 # Possible values: 'always', 'never', 'auto' (default).
-nbsphinx_execute = "auto"
+# On CI, notebooks are executed in a separate workflow, so the documentation build
+# does not need to run them again.
+nbsphinx_execute = "never" if os.environ.get("CI") else "auto"
 
 # List of arguments to be passed to the kernel that executes the notebooks:
 nbsphinx_execute_arguments = [
@@ -241,9 +243,9 @@ myst_update_mathjax = False  # needed for mathjax compatibility with nbsphinx
 myst_enable_extensions = ["dollarmath", "amsmath"]
 
 # Sphinx Bibtex configuration
-bibtex_bibfiles = []
-for f in Path("research/bibliography").glob("*.bib"):
-    bibtex_bibfiles.append(str(f))
+# Sorted, such that the configuration (and thus Sphinx's build cache) does not depend on
+# the order in which the file system lists the files
+bibtex_bibfiles = sorted(str(f) for f in Path("research/bibliography").glob("*.bib"))
 bibtex_default_style = "unsrtalpha"
 bibtex_reference_style = "label"
 bibtex_encoding = "utf-8-sig"
@@ -6,6 +6,8 @@ equations using probabilistic inference. This approach captures uncertainty aris
 finite computational resources and stochastic input.
 """
 
+from typing import TYPE_CHECKING
+
 # isort: off
 
 # Global Configuration
@@ -14,29 +16,59 @@ finite computational resources and stochastic input.
 # unguarded global state and is hence not thread-safe!
 from ._config import _GLOBAL_CONFIG_SINGLETON as config
 
-# Abstract interfaces for (components of) probabilistic numerical methods.
-from ._pnmethod import (
-    ProbabilisticNumericalMethod,
-    StoppingCriterion,
-    LambdaStoppingCriterion,
-)
-
 # isort: on
 
-from . import (
-    diffeq,
-    filtsmooth,
-    functions,
-    linalg,
-    linops,
-    problems,
-    quad,
-    randprocs,
-    randvars,
-    utils,
-)
+from . import _lazy
 from ._version import version as __version__
-from .randvars import asrandvar
+
+if TYPE_CHECKING:  # pragma: no cover
+    from . import (
+        diffeq,
+        filtsmooth,
+        functions,
+        linalg,
+        linops,
+        problems,
+        quad,
+        randprocs,
+        randvars,
+        typing,
+        utils,
+    )
+    from ._pnmethod import (
+        LambdaStoppingCriterion,
+        ProbabilisticNumericalMethod,
+        StoppingCriterion,
+    )
+    from .randvars import asrandvar
+
+# Subpackages are imported lazily on first attribute access (PEP 562). This keeps
+# `import probnum` cheap, since most subpackages transitively import SciPy.
+__getattr__, __dir__ = _lazy.attach(
+    __name__,
+    submodules=[
+        "diffeq",
+        "filtsmooth",
+        "functions",
+        "linalg",
+        "linops",
+        "problems",
+        "quad",
+        "randprocs",
+        "randvars",
+        "typing",
+        "utils",
+    ],
+    submod_attrs={
+        "_pnmethod": [
+            "ProbabilisticNumericalMethod",
+            "StoppingCriterion",
+            "LambdaStoppingCriterion",
+        ],
+        "randvars": ["asrandvar"],
+    },
+)
+
 
 # Public classes and functions. Order is reflected in documentation.
 __all__ = [
@@ -46,7 +78,6 @@ __all__ = [
     "LambdaStoppingCriterion",
 ]
 
-# Set correct module paths. Corrects links and module paths in documentation.
-ProbabilisticNumericalMethod.__module__ = "probnum"
-StoppingCriterion.__module__ = "probnum"
-LambdaStoppingCriterion.__module__ = "probnum"
+# Documentation builds need a fully populated namespace
+if _lazy.eager_import_requested():
+    _lazy.eager_import(__name__)
@@ -1,8 +1,7 @@
 """ProbNum library configuration"""
 
-import contextlib
 import dataclasses
-from typing import Any
+from typing import Any, Dict, Optional
 
 
 class Configuration:
@@ -70,24 +69,9 @@ class Configuration:
     def __repr__(self) -> str:
         return repr(self._options_registry)
 
-    @contextlib.contextmanager
-    def __call__(self, **kwargs) -> None:
+    def __call__(self, **kwargs) -> "_ConfigurationContext":
         """Context manager used to set values of registered config options."""
-        old_options = {}
-
-        for key, value in kwargs.items():
-            if key not in self._options_registry:
-                raise AttributeError(Configuration._NON_REGISTERED_KEY_ERR_MSG % key)
-
-            old_options[key] = self._options_registry[key].value
-
-            self._options_registry[key].value = value
-
-        try:
-            yield
-        finally:
-            for key, old_value in old_options.items():
-                self._options_registry[key].value = old_value
+        return _ConfigurationContext(self._options_registry, kwargs)
 
     def register(self, key: str, default_value: Any, description: str) -> None:
         r"""Register a new configuration option.
@@ -121,6 +105,48 @@ class Configuration:
         self._options_registry[key] = new_config_option
 
 
+class _ConfigurationContext:
+    """Context in which the values of configuration options are temporarily
+    overwritten.
+
+    This is a plain class with ``__slots__`` rather than a
+    :func:`contextlib.contextmanager`, since the latter allocates a generator each time
+    a context is entered.
+    """
+
+    __slots__ = ("_options_registry", "_new_values", "_old_values")
+
+    def __init__(
+        self,
+        options_registry: Dict[str, Configuration.Option],
+        new_values: Dict[str, Any],
+    ) -> None:
+        self._options_registry = options_registry
+        self._new_values = new_values
+        self._old_values: Optional[Dict[str, Any]] = None
+
+    def __enter__(self) -> None:
+        options_registry = self._options_registry
+
+        for key in self._new_values:
+            if key not in options_registry:
+                raise AttributeError(Configuration._NON_REGISTERED_KEY_ERR_MSG % key)
+
+        self._old_values = {}
+
+        for key, value in self._new_values.items():
+            option = options_registry[key]
+
+            self._old_values[key] = option.value
+            option.value = value
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        for key, old_value in self._old_values.items():
+            self._options_registry[key].value = old_value
+
+        self._old_values = None
+
+
 # Create a single, global configuration object,...
 _GLOBAL_CONFIG_SINGLETON = Configuration()
 
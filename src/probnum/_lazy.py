@@ -0,0 +1,89 @@
+"""Lazy loading of subpackages and their attributes.
+
+Follows the ``attach`` interface of the Scientific Python `lazy_loader
+<https://scientific-python.org/specs/spec-0001/>`_ specification, without adding a
+dependency.
+"""
+
+import importlib
+import os
+import sys
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def attach(
+    package_name: str,
+    submodules: Optional[Iterable[str]] = None,
+    submod_attrs: Optional[Dict[str, Iterable[str]]] = None,
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """Attach lazily loaded submodules and attributes to a package.
+
+    Parameters
+    ----------
+    package_name
+        Name of the package, typically ``__name__``.
+    submodules
+        Names of the submodules, which should be loaded on first access.
+    submod_attrs
+        Mapping from submodule names to names of attributes of the respective
+        submodule, which should be exposed in the namespace of the package.
+
+    Returns
+    -------
+    __getattr__
+        Module-level ``__getattr__`` (see :pep:`562`) resolving the lazy names.
+    __dir__
+        Module-level ``__dir__`` listing the names in the namespace of the package,
+        including the lazy names.
+    """
+    submodules = set(submodules if submodules is not None else ())
+    submod_attrs = submod_attrs if submod_attrs is not None else {}
+
+    attr_to_modules = {
+        attr: submod for submod, attrs in submod_attrs.items() for attr in attrs
+    }
+
+    lazy_names = submodules | attr_to_modules.keys()
+
+    def __getattr__(name: str) -> object:
+        if name in submodules:
+            return importlib.import_module(f"{package_name}.{name}")
+
+        if name in attr_to_modules:
+            submod = importlib.import_module(f"{package_name}.{attr_to_modules[name]}")
+            value = getattr(submod, name)
+
+            # Cache the resolved attribute, such that `__getattr__` is only called
+            # once per name
+            setattr(sys.modules[package_name], name, value)
+
+            return value
+
+        raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+    def __dir__() -> List[str]:
+        return sorted(vars(sys.modules[package_name]).keys() | lazy_names)
+
+    return __getattr__, __dir__
+
+
+def eager_import_requested() -> bool:
+    """Whether lazily loaded names should be imported eagerly.
+
+    This is the case if the environment variable ``SPHINX_BUILD`` is set to ``1`` or
+    ``true``, such that documentation tooling sees a fully populated namespace.
+    """
+    return os.environ.get("SPHINX_BUILD", "").lower() in ("1", "true")
+
+
+def eager_import(package_name: str) -> None:
+    """Resolve all lazily loaded names of a package attached via :func:`attach`.
+
+    Parameters
+    ----------
+    package_name
+        Name of the package, typically ``__name__``.
+    """
+    package = sys.modules[package_name]
+    for name in dir(package):
+        getattr(package, name)
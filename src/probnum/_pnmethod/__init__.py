@@ -9,3 +9,8 @@ __all__ = [
     "StoppingCriterion",
     "LambdaStoppingCriterion",
 ]
+
+# Set correct module paths. Corrects links and module paths in documentation.
+ProbabilisticNumericalMethod.__module__ = "probnum"
+StoppingCriterion.__module__ = "probnum"
+LambdaStoppingCriterion.__module__ = "probnum"
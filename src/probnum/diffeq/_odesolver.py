@@ -4,8 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import abc
-import dataclasses
-from typing import Iterable, Iterator, Optional, Union
+from typing import Iterable, Optional, Union
 
 import numpy as np
 
@@ -22,6 +21,16 @@ CallbackType = Union[
 ]
 """Callback interface type."""
 
+_INITIAL_BUFFER_SIZE = 256
+"""Initial size of the buffers collecting per-step quantities of a solver run."""
+
+
+def _grow_buffer(buffer: np.ndarray, num_used: int) -> np.ndarray:
+    """Double the size of a buffer if all of its entries are used."""
+    if num_used < buffer.shape[0]:
+        return buffer
+    return np.resize(buffer, max(2 * buffer.shape[0], _INITIAL_BUFFER_SIZE))
+
 
 class ODESolver(ABC):
     """Interface for ODE solvers in ProbNum."""
@@ -52,12 +61,16 @@ class ODESolver(ABC):
         callbacks
             Callbacks to happen after every accepted step.
         """
-        times, rvs = [], []
+        # The time grid is collected in a buffer whose size is doubled whenever it is
+        # exhausted. This avoids converting a list of floats into an array afterwards.
+        times = np.empty(_INITIAL_BUFFER_SIZE)
+        rvs = []
         for state in self.solution_generator(ivp, stop_at=stop_at, callbacks=callbacks):
-            times.append(state.t)
+            times = _grow_buffer(times, len(rvs))
+            times[len(rvs)] = state.t
             rvs.append(state.rv)
 
-        odesol = self.rvlist_to_odesol(times=times, rvs=rvs)
+        odesol = self.rvlist_to_odesol(times=times[: len(rvs)], rvs=rvs)
         return self.postprocess(odesol)
 
     def solution_generator(
@@ -68,17 +81,21 @@ class ODESolver(ABC):
     ):
         """Generate ODE solver steps."""
 
-        callbacks, stopper_state = self._process_event_inputs(callbacks, stop_at)
+        callbacks, time_stopper = self._process_event_inputs(callbacks, stop_at)
 
         state = self.initialize(ivp)
         yield state
 
         dt = self.steprule.firststep
 
+        if callbacks is None and time_stopper is None:
+            yield from self._steps_without_events(state, dt)
+            return
+
         # Use state.ivp in case a callback modifies the IVP
         while state.t < state.ivp.tmax:
-            if stopper_state is not None:
-                dt, stopper_state = _adjust_time_step(stopper_state, t=state.t, dt=dt)
+            if time_stopper is not None:
+                dt = time_stopper.adjust_dt(t=state.t, dt=dt)
 
             state, dt = self.perform_full_step(state, dt)
 
@@ -89,6 +106,21 @@ class ODESolver(ABC):
             self.num_steps += 1
             yield state
 
+    def _steps_without_events(self, state, dt):
+        """Generate ODE solver steps in the absence of callbacks and time stops.
+
+        This is a specialization of the loop in :meth:`solution_generator`, which does
+        not check for callbacks and time stops in every step.
+        """
+        perform_full_step = self.perform_full_step
+        tmax = state.ivp.tmax
+
+        while state.t < tmax:
+            state, dt = perform_full_step(state, dt)
+
+            self.num_steps += 1
+            yield state
+
     @staticmethod
     def _process_event_inputs(callbacks, stop_at_locations):
         """Process callbacks and time-stamps into a format suitable for solve()."""
@@ -99,10 +131,7 @@ class ODESolver(ABC):
         if callbacks is not None:
             callbacks = promote_callback_type(callbacks)
         if stop_at_locations is not None:
-            loc_iter = iter(stop_at_locations)
-            time_stopper = _TimeStopperState(
-                locations=loc_iter, next_location=next(loc_iter)
-            )
+            time_stopper = _TimeStopper(locations=stop_at_locations)
         else:
             time_stopper = None
         return callbacks, time_stopper
@@ -113,27 +142,35 @@ class ODESolver(ABC):
         This includes the acceptance/rejection decision as governed by error estimation
         and steprule.
         """
+        # Bind loop-invariant attributes to local variables,
+        # since the loop below is run once per attempted step
+        attempt_step = self.attempt_step
+        errorest_to_norm = self.steprule.errorest_to_norm
+        is_accepted = self.steprule.is_accepted
+        suggest = self.steprule.suggest
+        localconvrate = self.order + 1
+        t = state.t
+        tmax = state.ivp.tmax
+
         dt = initial_dt
         step_is_sufficiently_small = False
         proposed_state = None
         while not step_is_sufficiently_small:
-            proposed_state = self.attempt_step(state, dt)
+            proposed_state = attempt_step(state, dt)
 
             # Acceptance/Rejection due to the step-rule
-            internal_norm = self.steprule.errorest_to_norm(
+            internal_norm = errorest_to_norm(
                 errorest=proposed_state.error_estimate,
                 reference_state=proposed_state.reference_state,
             )
-            step_is_sufficiently_small = self.steprule.is_accepted(internal_norm)
-            suggested_dt = self.steprule.suggest(
-                dt, internal_norm, localconvrate=self.order + 1
-            )
+            step_is_sufficiently_small = is_accepted(internal_norm)
+            suggested_dt = suggest(dt, internal_norm, localconvrate=localconvrate)
 
             # Get a new step-size for the next step
             if step_is_sufficiently_small:
-                dt = min(suggested_dt, state.ivp.tmax - proposed_state.t)
+                dt = min(suggested_dt, tmax - proposed_state.t)
             else:
-                dt = min(suggested_dt, state.ivp.tmax - state.t)
+                dt = min(suggested_dt, tmax - t)
 
         self.method_callback(state)
         return proposed_state, dt
@@ -173,23 +210,24 @@ class ODESolver(ABC):
         """
 
 
-@dataclasses.dataclass
-class _TimeStopperState:
-    locations: Iterator
-    next_location: FloatLike
+class _TimeStopper:
+    """Adjust step-sizes such that the solver steps exactly through given locations.
+
+    The locations are stored as a sorted array, so the next location ahead of the
+    current time is found by binary search. This does not depend on any state of
+    previous calls.
+    """
 
+    def __init__(self, locations: Iterable[FloatLike]):
+        self._locations = np.sort(np.fromiter(locations, dtype=np.float64))
 
-def _adjust_time_step(stopper_state, t, dt):
-    if t >= stopper_state.next_location:
-        try:
-            next_location = next(stopper_state.locations)
-        except StopIteration:
-            next_location = np.inf
-    else:
-        next_location = stopper_state.next_location
+    def adjust_dt(self, t: FloatLike, dt: FloatLike) -> FloatLike:
+        """Shorten the step-size ``dt`` if the step would skip a location."""
+        idx = np.searchsorted(self._locations, t, side="right")
+        if idx == self._locations.size:
+            return dt
 
-    if t + dt > next_location:
-        dt = next_location - t
-    return dt, _TimeStopperState(
-        locations=stopper_state.locations, next_location=next_location
-    )
+        next_location = self._locations[idx]
+        if t + dt > next_location:
+            dt = next_location - t
+        return dt
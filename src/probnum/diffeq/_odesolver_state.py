@@ -1,14 +1,19 @@
 """ODE Solver states."""
 
 from dataclasses import dataclass
+import sys
 from typing import Optional
 
 import numpy as np
 
 from probnum import problems, randvars
 
+# States are created once per attempted step. Slots make them smaller and speed up
+# attribute access, but are only supported by `dataclass` from Python 3.10 onwards.
+_DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_KWARGS)
 class ODESolverState:
     """ODE solver states."""
 
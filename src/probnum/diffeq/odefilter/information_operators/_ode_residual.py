@@ -1,16 +1,51 @@
 """ODE residual information operators."""
 
+import functools
 from typing import Callable, Tuple
 
 import numpy as np
 
-from probnum import problems, randprocs
+from probnum import config, problems, randprocs
 from probnum.diffeq.odefilter.information_operators import _information_operator
 from probnum.typing import FloatLike, IntLike
 
 __all__ = ["ODEResidual"]
 
 
+@functools.lru_cache(maxsize=32)
+def _projections(
+    *,
+    num_prior_derivatives: int,
+    ode_dimension: int,
+    ode_order: int,
+    matrix_free: bool,
+) -> Tuple[Tuple[np.ndarray, ...], Tuple[np.ndarray, ...]]:
+    """Projection matrices to the derivatives of the state, and their indices.
+
+    The results are shared between all residuals of the same size, so the arrays are
+    read-only.
+    """
+    dummy_integrator = randprocs.markov.integrator.IntegratorTransition(
+        num_derivatives=num_prior_derivatives,
+        wiener_process_dimension=ode_dimension,
+    )
+    with config(matrix_free=matrix_free):
+        projection_matrices = tuple(
+            dummy_integrator.proj2coord(coord=deriv) for deriv in range(ode_order + 1)
+        )
+
+    # In the coordinate-wise ordering of the state, the `deriv`th derivative of the
+    # `i`th ODE dimension is at index `i * (num_prior_derivatives + 1) + deriv`
+    coord_offsets = np.arange(ode_dimension) * (num_prior_derivatives + 1)
+    projection_indices = tuple(coord_offsets + deriv for deriv in range(ode_order + 1))
+
+    for array in projection_matrices + projection_indices:
+        if isinstance(array, np.ndarray):
+            array.setflags(write=False)
+
+    return projection_matrices, projection_indices
+
+
 class ODEResidual(_information_operator.ODEInformationOperator):
     """Information operator that measures the residual of an explicit ODE."""
 
@@ -24,23 +59,34 @@ class ODEResidual(_information_operator.ODEInformationOperator):
         # Prepare caching the projection matrices
         self.projection_matrices = None
 
+        # The projection matrices select single entries of the state, so the residual
+        # is evaluated by indexing instead of multiplying with the (sparse) matrices
+        self._projection_indices = None
+
         # These will be assigned once the ODE has been seen
         self._residual = None
         self._residual_jacobian = None
 
+        # Most recent evaluations of the ODE vector field and its Jacobian. Linearizing
+        # the residual evaluates both repeatedly at the same point, which is identified
+        # by the key `(t, y.tobytes())`.
+        self._ode_f_key = None
+        self._ode_f_value = None
+        self._ode_df_key = None
+        self._ode_df_value = None
+
     def incorporate_ode(self, ode: problems.InitialValueProblem):
         """Incorporate the ODE and cache the required projection matrices."""
         super().incorporate_ode(ode=ode)
 
         # Cache the projection matrices and match the implementation to the ODE
-        dummy_integrator = randprocs.markov.integrator.IntegratorTransition(
-            num_derivatives=self.num_prior_derivatives,
-            wiener_process_dimension=self.ode_dimension,
-        )
         ode_order = 1  # currently everything we can do
-        self.projection_matrices = [
-            dummy_integrator.proj2coord(coord=deriv) for deriv in range(ode_order + 1)
-        ]
+        self.projection_matrices, self._projection_indices = _projections(
+            num_prior_derivatives=self.num_prior_derivatives,
+            ode_dimension=self.ode_dimension,
+            ode_order=ode_order,
+            matrix_free=config.matrix_free,
+        )
         res, res_jac = self._match_residual_and_jacobian_to_ode_order(
             ode_order=ode_order
         )
@@ -65,11 +111,34 @@ class ODEResidual(_information_operator.ODEInformationOperator):
     # Implementation of different residuals
 
     def _residual_first_order_ode(self, t: FloatLike, x: np.ndarray) -> np.ndarray:
-        h0, h1 = self.projection_matrices
-        return h1 @ x - np.asarray(self.ode.f(t, h0 @ x))
+        h0_idx, h1_idx = self._projection_indices
+        return x[h1_idx] - self._evaluate_ode_f(t, x[h0_idx])
 
     def _residual_first_order_ode_jacobian(
         self, t: FloatLike, x: np.ndarray
     ) -> np.ndarray:
-        h0, h1 = self.projection_matrices
-        return h1 - np.asarray(self.ode.df(t, h0 @ x) @ h0)
+        h0_idx, h1_idx = self._projection_indices
+        jacobian = np.zeros((self.output_dim, self.input_dim))
+        jacobian[np.arange(self.output_dim), h1_idx] = 1.0
+        jacobian[:, h0_idx] = np.negative(self._evaluate_ode_df(t, x[h0_idx]))
+        return jacobian
+
+    # Memoized evaluation of the ODE
+
+    def _evaluate_ode_f(self, t: FloatLike, y: np.ndarray) -> np.ndarray:
+        key = (t, y.tobytes())
+        if key == self._ode_f_key:
+            return self._ode_f_value
+
+        value = np.asarray(self.ode.f(t, y))
+        self._ode_f_key, self._ode_f_value = key, value
+        return value
+
+    def _evaluate_ode_df(self, t: FloatLike, y: np.ndarray) -> np.ndarray:
+        key = (t, y.tobytes())
+        if key == self._ode_df_key:
+            return self._ode_df_value
+
+        value = np.asarray(self.ode.df(t, y))
+        self._ode_df_key, self._ode_df_value = key, value
+        return value
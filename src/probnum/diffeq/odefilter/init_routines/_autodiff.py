@@ -1,6 +1,6 @@
 """Automatic-differentiation-based initialization routines."""
 
-import itertools
+import functools
 
 import numpy as np
 
@@ -8,30 +8,48 @@ from probnum import problems, randprocs, randvars
 
 from ._interface import InitializationRoutine
 
-# pylint: disable="import-outside-toplevel"
-try:
-    import jax
-    from jax.config import config
-    from jax.experimental.jet import jet
-    import jax.numpy as jnp
 
-    config.update("jax_enable_x64", True)
+@functools.lru_cache(maxsize=None)
+def _import_jax():
+    """Import JAX on first use.
 
-    JAX_IS_AVAILABLE = True
-except ImportError as JAX_IMPORT_ERROR:
-    JAX_IS_AVAILABLE = False
-    JAX_IMPORT_ERROR_MSG = (
-        "Cannot perform Jax-based initialization without the optional "
-        "dependencies jax and jaxlib. "
-        "Try installing them via `pip install jax jaxlib`."
-    )
+    Importing JAX is expensive, so this is deferred until an initialization routine
+    which requires JAX is instantiated.
+    """
+    # pylint: disable="import-outside-toplevel"
+    try:
+        import jax
+        from jax.experimental.jet import jet
+        import jax.numpy as jnp
+    except ImportError as err:
+        raise ImportError(
+            "Cannot perform Jax-based initialization without the optional "
+            "dependencies jax and jaxlib. "
+            "Try installing them via `pip install jax jaxlib`."
+        ) from err
+
+    return jax, jnp, jet
+
+
+@functools.lru_cache(maxsize=32)
+def _zero_covariance(dim: int) -> np.ndarray:
+    """Read-only zero matrix, which is shared between initializations of equal size."""
+    zeros = np.zeros((dim, dim))
+    zeros.setflags(write=False)
+    return zeros
 
 
 class _AutoDiffBase(InitializationRoutine):
     def __init__(self):
-
-        if not JAX_IS_AVAILABLE:
-            raise ImportError(JAX_IMPORT_ERROR_MSG) from JAX_IMPORT_ERROR
+        self._jax, self._jnp, self._jet = _import_jax()
+
+        # Compiled functions computing the ODE derivatives, keyed by the vector field
+        # and the number of derivatives, such that repeated initializations of the same
+        # IVP do not trace the vector field again. The cache is bounded, because it
+        # keeps the vector fields and their compiled executables alive.
+        self._compiled_derivatives = functools.lru_cache(maxsize=32)(
+            self._compile_derivatives
+        )
 
         super().__init__(is_exact=True, requires_jax=True)
 
@@ -44,57 +62,62 @@ class _AutoDiffBase(InitializationRoutine):
 
         num_derivatives = prior_process.transition.num_derivatives
 
-        f, y0 = self._make_autonomous(ivp=ivp)
-
-        mean_matrix = self._compute_ode_derivatives(
-            f=f, y0=y0, num_derivatives=num_derivatives
-        )
-        mean = mean_matrix.reshape((-1,), order="F")
-        zeros = jnp.zeros((mean.shape[0], mean.shape[0]))
-        return randvars.Normal(
-            mean=np.asarray(mean),
-            cov=np.asarray(zeros),
-            cov_cholesky=np.asarray(zeros),
+        # Compute in double precision without changing JAX's global configuration
+        with self._jax.experimental.enable_x64():
+            compute_ode_derivatives = self._compiled_derivatives(ivp.f, num_derivatives)
+            mean_matrix = compute_ode_derivatives(
+                t0=self._jnp.asarray(ivp.t0, dtype=float), y0=ivp.y0
+            )
+
+        # The derivatives are stacked along the last axis, so flattening yields the
+        # coordinate-wise ordering of the state without a transposed copy
+        mean = np.asarray(mean_matrix).reshape(-1)
+        zeros = _zero_covariance(mean.shape[0])
+        return randvars.Normal(mean=mean, cov=zeros, cov_cholesky=zeros)
+
+    def _compile_derivatives(self, f, num_derivatives):
+        return self._jax.jit(
+            functools.partial(
+                self._compute_ode_derivatives, f=f, num_derivatives=num_derivatives
+            )
         )
 
-    def _compute_ode_derivatives(self, *, f, y0, num_derivatives):
-        gen = self._initial_derivative_generator(f=f, y0=y0)
-        mean_matrix = jnp.stack(
-            [next(gen)(y0)[:-1] for _ in range(num_derivatives + 1)]
-        )
-        return mean_matrix
+    def _compute_ode_derivatives(self, *, f, t0, y0, num_derivatives):
+        f, y0 = self._make_autonomous(f=f, t0=t0, y0=y0)
+
+        # The number of derivatives is static, so the recursion unrolls into a single
+        # traced function: the (n+1)th derivative of the solution is the directional
+        # derivative of the nth derivative along the vector field.
+        derivatives = [y0]
+        g = f
+        for _ in range(num_derivatives):
+            derivatives.append(g(y0))
+            g = functools.partial(self._directional_derivative, fun=g, direction=f)
+
+        return self._jnp.stack([d[:-1] for d in derivatives], axis=-1)
 
-    def _make_autonomous(self, *, ivp):
+    def _make_autonomous(self, *, f, t0, y0):
         """Preprocess the ODE.
 
         Turn the ODE into a format that is more convenient to handle with automatic
         differentiation. This has no effect on the ODE itself. It is purely internal.
         """
-        y0_autonomous = jnp.concatenate([ivp.y0, jnp.array([ivp.t0])])
+        jnp = self._jnp
+
+        y0_autonomous = jnp.append(y0, t0)
+
+        # dt/dt = 1. The constant is created once instead of in every evaluation.
+        dt = jnp.ones((1,), dtype=y0_autonomous.dtype)
 
         def f_autonomous(y):
             x, t = y[:-1], y[-1]
-            fx = ivp.f(t, x)
-            return jnp.concatenate([fx, jnp.array([1.0])])
+            fx = f(t, x)
+            return jnp.concatenate([fx, dt])
 
         return f_autonomous, y0_autonomous
 
-    def _initial_derivative_generator(self, *, f, y0):
-        """Generate the inital derivatives recursively."""
-
-        def fwd_deriv(f, f0):
-            def df(x):
-                return self._jvp_or_vjp(fun=f, primals=x, tangents=f0(x))
-
-            return df
-
-        yield lambda x: y0
-
-        g = f
-        f0 = f
-        while True:
-            yield g
-            g = fwd_deriv(g, f0)
+    def _directional_derivative(self, x, *, fun, direction):
+        return self._jvp_or_vjp(fun=fun, primals=x, tangents=direction(x))
 
     def _jvp_or_vjp(self, *, fun, primals, tangents):
         raise NotImplementedError
@@ -104,7 +127,7 @@ class ForwardModeJVP(_AutoDiffBase):
     """Initialization via Jacobian-vector-product-based automatic differentiation."""
 
     def _jvp_or_vjp(self, *, fun, primals, tangents):
-        _, y = jax.jvp(fun, (primals,), (tangents,))
+        _, y = self._jax.jvp(fun, (primals,), (tangents,))
         return y
 
 
@@ -112,14 +135,21 @@ class ForwardMode(_AutoDiffBase):
     """Initialization via forward-mode automatic differentiation."""
 
     def _jvp_or_vjp(self, *, fun, primals, tangents):
-        return jax.jacfwd(fun)(primals) @ tangents
+        return self._jax.jacfwd(fun)(primals) @ tangents
 
 
 class ReverseMode(_AutoDiffBase):
     """Initialization via reverse-mode automatic differentiation."""
 
     def _jvp_or_vjp(self, *, fun, primals, tangents):
-        return jax.jacrev(fun)(primals) @ tangents
+        # The pullback u -> J^T u is linear, so pulling back through it once more
+        # yields the Jacobian-vector product J v without materializing J.
+        # The vector field maps R^d to R^d, so `tangents` is a valid point to
+        # linearize the pullback at.
+        _, pullback = self._jax.vjp(fun, primals)
+        _, transposed_pullback = self._jax.vjp(pullback, tangents)
+        (jvp,) = transposed_pullback((tangents,))
+        return jvp
 
 
 class TaylorMode(_AutoDiffBase):
@@ -196,65 +226,51 @@ class TaylorMode(_AutoDiffBase):
     [0. 0. 0. 0. 0. 0. 0. 0.]
     """
 
-    def _compute_ode_derivatives(self, *, f, y0, num_derivatives):
+    def _compute_ode_derivatives(self, *, f, t0, y0, num_derivatives):
 
         # Compute the ODE derivatives by computing an nth-order Taylor
-        # approximation of the function g(t) = f(x(t))
-        taylor_coefficients = self._taylor_approximation(
-            f=f, y0=y0, order=num_derivatives
-        )
-
-        # The `f` parameter is an autonomous ODE vector field that
-        # used to be a non-autonomous ODE vector field.
-        # Therefore, we eliminate the final column of the result,
-        # which would correspond to the `t`-part in f(t, y(t)).
-        return taylor_coefficients[:, :-1]
+        # approximation of the function g(t) = f(t, x(t))
+        return self._taylor_approximation(f=f, t0=t0, y0=y0, order=num_derivatives)
 
-    def _taylor_approximation(self, *, f, y0, order):
-        """Compute an `n`th order Taylor approximation of f at y0."""
-        taylor_coefficient_gen = self._taylor_coefficient_generator(f=f, y0=y0)
+    def _taylor_approximation(self, *, f, t0, y0, order):
+        """Compute an `n`th order Taylor approximation of f at y0.
 
-        # Get the 'order'th entry of the coefficient-generator via itertools.islice
-        # The result is a tuple of length 'order+1', each entry of which
-        # corresponds to a derivative / Taylor coefficient.
-        derivatives = next(itertools.islice(taylor_coefficient_gen, order, None))
-
-        # The shape of this array is (order+1, ode_dim+1).
-        # 'order+1' since a 0th order approximation has 1 coefficient (f(x0)),
-        # a 1st order approximation has 2 coefficients (f(x0), df(x0)), etc.
-        # 'ode_dim+1' since we tranformed the ODE into an autonomous ODE.
-        derivatives_as_array = jnp.stack(derivatives, axis=0)
-        return derivatives_as_array
-
-    @staticmethod
-    def _taylor_coefficient_generator(*, f, y0):
-        """Generate Taylor coefficients.
-
-        Generate Taylor-series-coefficients of the ODE solution `x(t)` via generating
-        Taylor-series-coefficients of `g(t)=f(x(t))` via ``jax.experimental.jet()``.
+        The Taylor-series-coefficients of the ODE solution `x(t)` are computed via the
+        Taylor-series-coefficients of `g(t)=f(t, x(t))` using
+        ``jax.experimental.jet()``.
         """
 
         # This is the 0th Taylor coefficient of x(t) at t=t0.
         x_primals = y0
-        yield (x_primals,)
 
         # This contains the higher-order, unnormalised
         # Taylor coefficients of x(t) at t=t0.
         # We know them because of the ODE.
-        x_series = (f(y0),)
+        x_series = (f(t0, y0),) if order > 0 else ()
+
+        # The Taylor coefficients of t itself are (t0, 1, 0, 0, ...), so the ODE
+        # need not be made autonomous by augmenting the state with the time.
+        t_one, t_zero = self._jnp.ones_like(t0), self._jnp.zeros_like(t0)
 
-        while True:
-            yield (x_primals,) + x_series
+        for _ in range(1, order):
+            t_series = (t_one,) + (t_zero,) * (len(x_series) - 1)
 
-            # jet() computes a Taylor approximation of g(t) := f(x(t))
+            # jet() computes a Taylor approximation of g(t) := f(t, x(t))
             # The output is the zeroth Taylor approximation g(t_0) ('primals')
             # as well its higher-order Taylor coefficients ('series')
-            g_primals, g_series = jet(fun=f, primals=(x_primals,), series=(x_series,))
+            g_primals, g_series = self._jet(
+                fun=f, primals=(t0, x_primals), series=(t_series, x_series)
+            )
 
-            # For ODEs \dot y(t) = f(y(t)),
+            # For ODEs \dot y(t) = f(t, y(t)),
             # The nth Taylor coefficient of y is the
-            # (n-1)th Taylor coefficient of g(t) = f(y(t)).
+            # (n-1)th Taylor coefficient of g(t) = f(t, y(t)).
             # This way, by augmenting x0 with the Taylor series
-            # approximating g(t) = f(y(t)), we increase the order
+            # approximating g(t) = f(t, y(t)), we increase the order
             # of the approximation by 1.
             x_series = (g_primals, *g_series)
+
+        # The shape of this array is (ode_dim, order+1).
+        # 'order+1' since a 0th order approximation has 1 coefficient (f(x0)),
+        # a 1st order approximation has 2 coefficients (f(x0), df(x0)), etc.
+        return self._jnp.stack((x_primals, *x_series), axis=-1)
@@ -37,7 +37,5 @@ class WrappedScipyODESolution(_odesolution.ODESolution):
         if np.isscalar(t):
             solution_as_rv = randvars.Constant(states)
         else:
-            solution_as_rv = randvars._RandomVariableList(
-                [randvars.Constant(state) for state in states]
-            )
+            solution_as_rv = randvars._RandomVariableList._from_constant_array(states)
         return solution_as_rv
@@ -2,7 +2,6 @@
 from typing import Optional, Union
 
 import numpy as np
-import scipy
 
 from probnum.typing import FloatLike, IntLike, ShapeLike
 
@@ -40,11 +39,11 @@ def perturb_uniform(
     if step >= 1.0:
         raise ValueError("Stepsize too large (>= 1)")
 
-    uniform_rv_samples = scipy.stats.uniform.rvs(random_state=rng, size=size)
     shift = noise_scale * step ** (solver_order + 0.5)
     left_boundary = step - shift
     right_boundary = step + shift
-    samples = left_boundary + (right_boundary - left_boundary) * uniform_rv_samples
+
+    samples = rng.uniform(low=left_boundary, high=right_boundary, size=size)
     return samples
 
 
@@ -82,9 +81,6 @@ def perturb_lognormal(
     shift = 0.5 * np.log(1 + noise_scale * (step ** (2 * solver_order)))
     mean = np.log(step) - shift
     cov = 2 * shift
-    samples = np.exp(
-        scipy.stats.multivariate_normal.rvs(
-            mean=mean, cov=cov, size=size, random_state=rng
-        )
-    )
+
+    samples = rng.lognormal(mean=mean, sigma=np.sqrt(cov), size=size)
     return samples
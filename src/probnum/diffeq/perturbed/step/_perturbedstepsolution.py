@@ -15,7 +15,7 @@ class PerturbedStepSolution(_odesolution.ODESolution):
 
     def __init__(
         self,
-        scales: List[float],
+        scales: np.ndarray,
         locations: np.ndarray,
         states: randvars._RandomVariableList,
         interpolants: List[rk.DenseOutput],
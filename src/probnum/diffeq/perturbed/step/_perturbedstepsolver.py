@@ -1,5 +1,6 @@
 """ODE-Solver as proposed by Abdulle and Garegnani."""
 
+import functools
 from typing import Callable
 
 import numpy as np
@@ -11,7 +12,7 @@ from probnum.diffeq.perturbed.step import (
     _perturbation_functions,
     _perturbedstepsolution,
 )
-from probnum.typing import FloatLike
+from probnum.typing import ArrayLike, FloatLike
 
 
 class PerturbedStepSolver(_odesolver.ODESolver):
@@ -47,19 +48,19 @@ class PerturbedStepSolver(_odesolver.ODESolver):
         noise_scale: FloatLike,
         perturb_function: Callable,
     ):
-        def perturb_step(rng, step):
-            return perturb_function(
-                rng=rng,
-                step=step,
-                solver_order=solver.order,
-                noise_scale=noise_scale,
-                size=(),
-            )
-
         self.rng = rng
-        self.perturb_step = perturb_step
+        self.perturb_step = functools.partial(
+            perturb_function,
+            solver_order=solver.order,
+            noise_scale=noise_scale,
+            size=(),
+        )
         self.solver = solver
-        self.scales = None
+
+        # Only the first `_num_scales` entries of the buffer are valid
+        self._scales = None
+        self._num_scales = 0
+        self._attempted_scale = None
         super().__init__(steprule=solver.steprule, order=solver.order)
 
     @classmethod
@@ -92,9 +93,22 @@ class PerturbedStepSolver(_odesolver.ODESolver):
             perturb_function=pertfun,
         )
 
+    @property
+    def scales(self) -> np.ndarray:
+        """Ratios of the perturbed and the proposed step-sizes of all accepted steps."""
+        if self._scales is None:
+            return None
+        return self._scales[: self._num_scales]
+
+    @scales.setter
+    def scales(self, scales: ArrayLike):
+        self._scales = np.array(scales, dtype=np.float64)
+        self._num_scales = self._scales.shape[0]
+
     def initialize(self, ivp):
         """Initialise and reset the solver."""
-        self.scales = []
+        self._scales = np.empty(_odesolver._INITIAL_BUFFER_SIZE)
+        self._num_scales = 0
         return self.solver.initialize(ivp)
 
     def attempt_step(self, state: _odesolver_state.ODESolverState, dt: FloatLike):
@@ -115,10 +129,11 @@ class PerturbedStepSolver(_odesolver.ODESolver):
         _odesolver_state.ODESolverState
             New state.
         """
-        noisy_step = self.perturb_step(self.rng, dt)
+        noisy_step = self.perturb_step(rng=self.rng, step=dt)
         new_state = self.solver.attempt_step(state, noisy_step)
-        scale = noisy_step / dt
-        self.scales.append(scale)
+
+        # The scale is only recorded once the step is accepted (see `method_callback`)
+        self._attempted_scale = noisy_step / dt
 
         t_new = state.t + dt
         state = _odesolver_state.ODESolverState(
@@ -131,7 +146,11 @@ class PerturbedStepSolver(_odesolver.ODESolver):
         return state
 
     def method_callback(self, state):
-        """Call dense output after each step and store the interpolants."""
+        """Call dense output after each step and store the interpolants and scales."""
+        self._scales = _odesolver._grow_buffer(self._scales, self._num_scales)
+        self._scales[self._num_scales] = self._attempted_scale
+        self._num_scales += 1
+
         return self.solver.method_callback(state)
 
     def rvlist_to_odesol(self, times: np.ndarray, rvs: randvars._RandomVariableList):
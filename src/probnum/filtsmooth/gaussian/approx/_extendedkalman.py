@@ -118,12 +118,25 @@ class DiscreteEKFComponent(
 
         x0 = at_this_rv.mean
 
+        # The transition matrix and the noise both need the Jacobian at the same
+        # time point, so evaluate the linearization only once per time point
+        cache = [None, None]
+
+        def linearization(t):
+            cached_t, cached_value = cache
+            if cached_value is None or t != cached_t:
+                jacobian = dg(t, x0)
+                cached_value = (jacobian, g(t, x0) - jacobian @ x0)
+                cache[:] = [t, cached_value]
+            return cached_value
+
         def transition_matrix_fun(t):
-            return dg(t, x0)
+            jacobian, _ = linearization(t)
+            return jacobian
 
         def noise_fun(t):
             pnoise = self.non_linear_model.noise_fun(t)
-            m = g(t, x0) - dg(t, x0) @ x0
+            _, m = linearization(t)
             return m + pnoise
 
         return randprocs.markov.discrete.LinearGaussian(
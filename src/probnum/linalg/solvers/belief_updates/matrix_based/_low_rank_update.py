@@ -0,0 +1,51 @@
+"""Lazy low-rank updates of linear operators for matrix-based belief updates."""
+import numpy as np
+
+from probnum import linops
+from probnum.typing import LinearOperatorLike
+
+
+def low_rank_update(
+    op: LinearOperatorLike, U: np.ndarray, V: np.ndarray
+) -> linops.LinearOperator:
+    r"""Linear operator :math:`A + U V^\top`, where the update is never formed densely.
+
+    If ``op`` is itself the result of a low-rank update, the factors are appended to
+    the existing ones. Hence, the sum of all updates made by a linear solver is applied
+    by two matrix products, instead of one product per solver iteration.
+
+    Parameters
+    ----------
+    op
+        Linear operator :math:`A` of shape ``(m, n)`` to update.
+    U
+        Left factor of shape ``(m,)`` or ``(m, k)``.
+    V
+        Right factor of shape ``(n,)`` or ``(n, k)``.
+    """
+    U = U.reshape(U.shape[0], -1)
+    V = V.reshape(V.shape[0], -1)
+
+    if isinstance(op, _LowRankUpdate):
+        return _LowRankUpdate(op.base, np.hstack((op.U, U)), np.hstack((op.V, V)))
+
+    return _LowRankUpdate(linops.aslinop(op), U, V)
+
+
+class _LowRankUpdate(linops.LambdaLinearOperator):
+    r"""Linear operator :math:`A + U V^\top` with the update in factored form."""
+
+    def __init__(self, base: linops.LinearOperator, U: np.ndarray, V: np.ndarray):
+        self.base = base
+        self.U = U
+        self.V = V
+
+        super().__init__(
+            shape=base.shape,
+            dtype=np.result_type(base.dtype, U, V),
+            matmul=lambda x: self.base @ x + self.U @ (self.V.T @ x),
+            todense=lambda: self.base.todense(cache=False) + self.U @ self.V.T,
+            transpose=lambda: _LowRankUpdate(self.base.T, self.V, self.U),
+            trace=lambda: self.base.trace() + np.sum(self.U * self.V),
+            diagonal=lambda: self.base.diagonal() + np.sum(self.U * self.V, axis=-1),
+        )
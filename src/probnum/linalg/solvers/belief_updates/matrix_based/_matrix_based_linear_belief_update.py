@@ -7,6 +7,7 @@ from probnum import linops, randvars
 from probnum.linalg.solvers.beliefs import LinearSystemBelief
 
 from .._linear_solver_belief_update import LinearSolverBeliefUpdate
+from ._low_rank_update import low_rank_update
 
 
 class MatrixBasedLinearBeliefUpdate(LinearSolverBeliefUpdate):
@@ -70,20 +71,21 @@ class MatrixBasedLinearBeliefUpdate(LinearSolverBeliefUpdate):
                 """
             )
 
-        pred = matrix.mean @ action
-        resid = observ - pred
         covfactor_Ms = matrix.cov.B @ action
         gram = action.T @ covfactor_Ms
-        gram_pinv = 1.0 / gram if gram > 0.0 else 0.0
-        gain = covfactor_Ms * gram_pinv
-        covfactor_update = linops.aslinop(gain[:, None]) @ linops.aslinop(
-            covfactor_Ms[None, :]
-        )
-        resid_gain = linops.aslinop(resid[:, None]) @ linops.aslinop(
-            gain[None, :]
-        )  # residual and gain are flipped due to matrix vectorization
+
+        if not gram > 0.0:
+            # The gain vanishes, so the belief remains unchanged
+            return matrix
+
+        pred = matrix.mean @ action
+        resid = observ - pred
+        gain = covfactor_Ms * (1.0 / gram)
 
         return randvars.Normal(
-            mean=matrix.mean + resid_gain,
-            cov=linops.Kronecker(A=matrix.cov.A, B=matrix.cov.B - covfactor_update),
+            # residual and gain are flipped due to matrix vectorization
+            mean=low_rank_update(matrix.mean, resid, gain),
+            cov=linops.Kronecker(
+                A=matrix.cov.A, B=low_rank_update(matrix.cov.B, gain, -covfactor_Ms)
+            ),
         )
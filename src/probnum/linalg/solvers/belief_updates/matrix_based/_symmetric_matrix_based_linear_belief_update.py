@@ -7,6 +7,7 @@ from probnum import linops, randvars
 from probnum.linalg.solvers.beliefs import LinearSystemBelief
 
 from .._linear_solver_belief_update import LinearSolverBeliefUpdate
+from ._low_rank_update import low_rank_update
 
 
 class SymmetricMatrixBasedLinearBeliefUpdate(LinearSolverBeliefUpdate):
@@ -72,22 +73,24 @@ class SymmetricMatrixBasedLinearBeliefUpdate(LinearSolverBeliefUpdate):
                 """
             )
 
-        pred = matrix.mean @ action
-        resid = observ - pred
         covfactor_Ms = matrix.cov.A @ action
         gram = action.T @ covfactor_Ms
-        gram_pinv = 1.0 / gram if gram > 0.0 else 0.0
-        gain = covfactor_Ms * gram_pinv
-        covfactor_update = linops.aslinop(gain[:, None]) @ linops.aslinop(
-            covfactor_Ms[None, :]
-        )
-        resid_gain = linops.aslinop(resid[:, None]) @ linops.aslinop(gain[None, :])
+
+        if not gram > 0.0:
+            # The gain vanishes, so the belief remains unchanged
+            return matrix
+
+        pred = matrix.mean @ action
+        resid = observ - pred
+        gain = covfactor_Ms * (1.0 / gram)
 
         return randvars.Normal(
-            mean=matrix.mean
-            + resid_gain
-            + resid_gain.T
-            - linops.aslinop(gain[:, None])
-            @ linops.aslinop((action.T @ resid_gain)[None, :]),
-            cov=linops.SymmetricKronecker(A=matrix.cov.A - covfactor_update),
+            mean=low_rank_update(
+                matrix.mean,
+                np.stack((resid, gain, gain), axis=-1),
+                np.stack((gain, resid, -(action.T @ resid) * gain), axis=-1),
+            ),
+            cov=linops.SymmetricKronecker(
+                A=low_rank_update(matrix.cov.A, gain, -covfactor_Ms)
+            ),
         )
@@ -3,7 +3,7 @@ projecting the current residual to a subspace."""
 import numpy as np
 
 import probnum  # pylint: disable="unused-import"
-from probnum import randvars
+from probnum import linops, randvars
 from probnum.linalg.solvers.beliefs import LinearSystemBelief
 from probnum.typing import FloatLike
 
@@ -51,8 +51,24 @@ class ProjectedResidualBeliefUpdate(LinearSolverBeliefUpdate):
         action_A = solver_state.action.T @ solver_state.problem.A
         cov_xy = solver_state.belief.x.cov @ action_A.T
         gram = action_A @ cov_xy + self.noise_var
-        gram_pinv = 1.0 / gram if gram > 0.0 else 0.0
-        gain = cov_xy * gram_pinv
+
+        if not gram > 0.0:
+            # The gain vanishes, so x, A and b are reused and a missing belief about
+            # the inverse falls back to zero, without allocating a dense matrix
+            return LinearSystemBelief(
+                x=solver_state.belief.x,
+                A=solver_state.belief.A,
+                Ainv=(
+                    randvars.Constant(
+                        linops.Zero(shape=solver_state.belief.x.cov.shape)
+                    )
+                    if solver_state.belief.Ainv is None
+                    else solver_state.belief.Ainv
+                ),
+                b=solver_state.belief.b,
+            )
+
+        gain = cov_xy * (1.0 / gram)
         cov_update = np.outer(gain, cov_xy)
 
         x = randvars.Normal(
@@ -1,5 +1,8 @@
 """IVP examples that use jax."""
 
+import functools
+import warnings
+
 import numpy as np
 
 from probnum.problems import InitialValueProblem
@@ -87,6 +90,7 @@ def threebody_jax(tmax=17.0652165601579625588917206249):
     return InitialValueProblem(f=rhs, t0=t0, tmax=tmax, y0=y0, df=jac, ddf=hess)
 
 
+@functools.lru_cache(maxsize=None)
 def _import_jax():
     errormsg = (
         "IVP instantiation requires jax. "
@@ -96,15 +100,21 @@ def _import_jax():
 
     try:
         import jax
-        from jax.config import config
         import jax.numpy as jnp
-
-        config.update("jax_enable_x64", True)
-        return jax, jnp
-
     except ImportError as err:
         raise ImportError(errormsg) from err
 
+    # Enabling double precision here would change JAX's global configuration and
+    # invalidate all previously compiled functions, so leave the choice to the user
+    if not jax.config.jax_enable_x64:
+        warnings.warn(
+            "JAX is configured to use single precision. "
+            "Call `jax.config.update('jax_enable_x64', True)` "
+            "to evaluate the IVP in double precision."
+        )
+
+    return jax, jnp
+
 
 def vanderpol_jax(t0=0.0, tmax=30, y0=None, params=1e1):
     r"""Initial value problem (IVP) based on the Van der Pol Oscillator,
@@ -706,6 +706,27 @@ class CovarianceFunction(abc.ABC):
 
         return np.sum(prods, axis=tuple(range(-self.input_ndim, 0)))
 
+    def _euclidean_inner_product_matrix(
+        self,
+        x0: np.ndarray,
+        x1: Optional[np.ndarray],
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Matrix of pairwise Euclidean inner products of two batches of inputs, which
+        supports scalar inputs and an optional second argument.
+
+        In contrast to broadcasting :meth:`_euclidean_inner_products`, this does not
+        form an intermediate array of shape ``(N0, N1) + input_shape``."""
+        if x1 is None:
+            x1 = x0
+
+        if self.input_ndim == 0:
+            return np.multiply.outer(x0, x1, out=out)
+
+        assert self.input_ndim == 1
+
+        return np.matmul(x0, x1.T, out=out)
+
     ####################################################################################
     # Binary Arithmetic
     ####################################################################################
@@ -48,3 +48,6 @@ class Linear(CovarianceFunction):
 
     def _evaluate(self, x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
         return self._euclidean_inner_products(x0, x1) + self.constant
+
+    def _evaluate_matrix(self, x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
+        return self._euclidean_inner_product_matrix(x0, x1) + self.constant
@@ -50,7 +50,89 @@ class Polynomial(CovarianceFunction):
     ):
         self.constant = _utils.as_numpy_scalar(constant)
         self.exponent = _utils.as_numpy_scalar(exponent)
+
+        # Small integral exponents are evaluated by repeated multiplication, since
+        # `np.power` only special-cases exponents up to 2 and otherwise calls `pow`
+        self._integer_exponent = (
+            int(self.exponent)
+            if float(self.exponent).is_integer() and 2 < self.exponent <= 16
+            else None
+        )
+
         super().__init__(input_shape=input_shape)
 
     def _evaluate(self, x0: np.ndarray, x1: Optional[np.ndarray] = None) -> np.ndarray:
-        return (self._euclidean_inner_products(x0, x1) + self.constant) ** self.exponent
+        return self._power(self._euclidean_inner_products(x0, x1) + self.constant)
+
+    def _evaluate_matrix(
+        self, x0: np.ndarray, x1: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        if x1 is None:
+            x1 = x0
+
+        kernmat = np.empty(
+            (x0.shape[0], x1.shape[0]),
+            dtype=np.result_type(x0, x1, self.constant, self.exponent),
+        )
+
+        # The covariance matrix is computed in blocks of rows, such that the offset and
+        # the power are applied while the block of inner products is still in cache
+        block_rows = max(1, _BLOCK_SIZE // (kernmat.itemsize * max(1, x1.shape[0])))
+
+        for start in range(0, x0.shape[0], block_rows):
+            block = kernmat[start : start + block_rows]
+
+            self._euclidean_inner_product_matrix(
+                x0[start : start + block_rows], x1, out=block
+            )
+            block += self.constant
+            self._power(block, out=block)
+
+        return kernmat
+
+    def _power(self, base: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        if self._integer_exponent is None:
+            return np.power(base, self.exponent, out=out)
+
+        return _integer_power(base, self._integer_exponent, out=out)
+
+
+_BLOCK_SIZE = 2**20
+"""Size in bytes of the blocks in which :meth:`Polynomial.matrix` is evaluated."""
+
+
+def _integer_power(
+    base: np.ndarray, exponent: int, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    r"""Computes ``base ** exponent`` for a positive integer ``exponent`` by binary
+    exponentiation, i.e. using :math:`\mathcal{O}(\log q)` multiplications.
+
+    If given, the result is written to ``out``, which may also be ``base`` itself."""
+    powers = np.asarray(base)
+    owns_powers = False
+    result = None
+
+    while True:
+        if exponent & 1:
+            if result is None:
+                if out is not None:
+                    result = out
+                    np.copyto(result, powers)
+                elif owns_powers and exponent == 1:
+                    # The powers of the base are only reused if there are further bits
+                    result = powers
+                else:
+                    result = powers.copy()
+            else:
+                np.multiply(result, powers, out=result)
+
+        exponent >>= 1
+
+        if exponent == 0:
+            return result
+
+        if owns_powers:
+            np.multiply(powers, powers, out=powers)
+        else:
+            powers = powers * powers
+            owns_powers = True
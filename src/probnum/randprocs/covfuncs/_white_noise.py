@@ -36,14 +36,20 @@ class WhiteNoise(CovarianceFunction):
         super().__init__(input_shape=input_shape)
 
     def _evaluate(self, x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
-        if x1 is None:
-            return np.full_like(  # pylint: disable=unexpected-keyword-arg
-                x0,
-                self.sigma_sq,
-                shape=x0.shape[: x0.ndim - self.input_ndim],
+        # Follow the floating-point precision of the inputs, like the other covariance
+        # functions do by virtue of NumPy's type promotion rules. The noise level is
+        # passed as a Python scalar, which is weakly typed also under NEP 50.
+        dtype = np.result_type(x0, x1 if x1 is not None else x0, self.sigma_sq.item())
+
+        # Identical inputs need not be compared elementwise
+        if x1 is None or x1 is x0:
+            return np.full(
+                x0.shape[: x0.ndim - self.input_ndim], self.sigma_sq, dtype=dtype
             )
 
         if self.input_shape == ():
-            return self.sigma_sq * (x0 == x1)
+            equal = x0 == x1
+        else:
+            equal = np.all(x0 == x1, axis=-1)
 
-        return self.sigma_sq * np.all(x0 == x1, axis=-1)
+        return np.multiply(self.sigma_sq, equal, dtype=dtype)
@@ -295,16 +295,22 @@ class LinearSDE(_sde.SDE):
             mean, cov_flat = y[:dim], y[dim:]
             cov = cov_flat.reshape((dim, dim))
 
-            # Apply iteration
+            # Apply iteration, writing straight into the vectorized outcome.
+            # The output is allocated per call, because solve_ivp may keep
+            # references to previous evaluations. Products are assigned
+            # rather than computed with `out=`, because G may be a
+            # LinearOperator, which does not support ufuncs.
             G = self.drift_matrix_function(t)
             u = self.force_vector_function(t)
             L = self.dispersion_matrix_function(t)
-            new_mean = G @ mean + u
-            new_cov = G @ cov + cov @ G.T + _diffusion * L @ L.T
-
-            # Vectorize outcome
-            new_cov_flat = new_cov.flatten()
-            y_new = np.hstack((new_mean, new_cov_flat))
+            y_new = np.empty_like(y)
+            new_mean = y_new[:dim]
+            new_cov = y_new[dim:].reshape((dim, dim))
+            new_mean[:] = G @ mean
+            new_mean += u
+            new_cov[:] = G @ cov
+            new_cov += cov @ G.T
+            new_cov += _diffusion * (L @ L.T)
             return y_new
 
         initcov_flat = initrv.cov.flatten()
@@ -2,6 +2,7 @@
 import functools
 
 import numpy as np
+import scipy.linalg
 
 from probnum import randvars
 from probnum.randprocs.markov import discrete
@@ -134,7 +135,10 @@ class LTISDE(_linear_sde.LinearSDE):
             _diffusion=_diffusion,
         )
 
-    @functools.lru_cache(maxsize=None)
+    # Bounded, because adaptive step-size selection requests a new step size in
+    # (almost) every step, and the cache keeps both the discretisations and the
+    # (possibly temporary) SDEs themselves alive
+    @functools.lru_cache(maxsize=64)
     def discretise(self, dt):
         """Return a discrete transition model (i.e. mild solution to SDE) using matrix
         fraction decomposition.
@@ -147,25 +151,19 @@ class LTISDE(_linear_sde.LinearSDE):
         which is the transition of the mild solution to the LTI SDE.
         """
 
-        if np.linalg.norm(self.force_vector) > 0:
-            zeros = np.zeros((self.state_dimension, self.state_dimension))
-            eye = np.eye(self.state_dimension)
-            drift_matrix = np.block([[self.drift_matrix, eye], [zeros, zeros]])
-            dispersion_matrix = np.concatenate(
-                (self.dispersion_matrix, np.zeros(self.dispersion_matrix.shape))
-            )
-            ah_stack, qh_stack, _ = _mfd.matrix_fraction_decomposition(
-                drift_matrix, dispersion_matrix, dt
-            )
-            proj = np.eye(self.state_dimension, 2 * self.state_dimension)
-            proj_rev = np.flip(proj, axis=1)
-            ah = proj @ ah_stack @ proj.T
-            sh = proj @ ah_stack @ proj_rev.T @ self.force_vector
-            qh = proj @ qh_stack @ proj.T
+        ah, qh, _ = _mfd.matrix_fraction_decomposition(
+            self.drift_matrix, self.dispersion_matrix, dt
+        )
+
+        if np.any(self.force_vector):
+            # The shift s(h) = \int_0^h \exp(G t) v dt is the top-right column of the
+            # exponential of the drift matrix augmented by the force vector
+            dim = self.state_dimension
+            drift_matrix = np.zeros((dim + 1, dim + 1))
+            drift_matrix[:dim, :dim] = self.drift_matrix
+            drift_matrix[:dim, dim] = self.force_vector
+            sh = scipy.linalg.expm(drift_matrix * dt)[:dim, dim]
         else:
-            ah, qh, _ = _mfd.matrix_fraction_decomposition(
-                self.drift_matrix, self.dispersion_matrix, dt
-            )
             sh = np.zeros(len(ah))
         return discrete.LTIGaussian(
             transition_matrix=ah,
@@ -12,12 +12,10 @@ def matrix_fraction_decomposition(drift_matrix, dispersion_matrix, dt):
     if dispersion_matrix.ndim == 1:
         dispersion_matrix = dispersion_matrix.reshape((-1, 1))
 
-    Phi = np.block(
-        [
-            [drift_matrix, dispersion_matrix @ dispersion_matrix.T],
-            [np.zeros(drift_matrix.shape), -drift_matrix.T],
-        ]
-    )
+    Phi = np.zeros((2 * dim, 2 * dim))
+    Phi[:dim, :dim] = drift_matrix
+    Phi[:dim, dim:] = dispersion_matrix @ dispersion_matrix.T
+    Phi[dim:, dim:] = -drift_matrix.T
     M = scipy.linalg.expm(Phi * dt)
 
     Ah = M[:dim, :dim]
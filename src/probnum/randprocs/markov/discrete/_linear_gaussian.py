@@ -55,6 +55,7 @@ class LinearGaussian(_nonlinear_gaussian.NonlinearGaussian):
         )
 
         # Choose implementation for forward and backward transitions
+        self._forward_implementation_string = forward_implementation
         self._forward_implementation = self._choose_forward_implementation(
             forward_implementation=forward_implementation
         )
@@ -83,6 +84,22 @@ class LinearGaussian(_nonlinear_gaussian.NonlinearGaussian):
     def transition_matrix_fun(self):
         return self._transition_matrix_fun
 
+    # Hook overridden by LTIGaussian, which returns a precomputed transpose
+    def _transposed_transition_matrix(  # pylint: disable=no-self-use
+        self, transition_matrix: LinearOperatorLike
+    ) -> LinearOperatorLike:
+        """Transpose of a transition matrix returned by ``transition_matrix_fun``."""
+        return transition_matrix.T
+
+    @staticmethod
+    def _scaled_noise_cov(
+        noise: randvars.RandomVariable, _diffusion: FloatLike
+    ) -> LinearOperatorLike:
+        """Noise covariance scaled by the diffusion, skipping unit diffusions."""
+        if _diffusion == 1.0:
+            return noise.cov
+        return _diffusion * noise.cov
+
     def forward_rv(self, rv, t, compute_gain=False, _diffusion=1.0, **kwargs):
 
         if config.matrix_free and not isinstance(rv.cov, linops.LinearOperator):
@@ -104,6 +121,16 @@ class LinearGaussian(_nonlinear_gaussian.NonlinearGaussian):
 
     def forward_realization(self, realization, t, _diffusion=1.0, **kwargs):
 
+        if self._forward_implementation_string == "classic" and not config.matrix_free:
+            # A realization has zero covariance, so the classic forward pass
+            # reduces to the noise model shifted by G(t) x.
+            H = self.transition_matrix_fun(t)
+            noise = self.noise_fun(t)
+            new_mean = H @ realization + noise.mean
+            new_cov = self._scaled_noise_cov(noise, _diffusion)
+            crosscov = np.zeros((self.input_dim, self.output_dim))
+            return randvars.Normal(new_mean, cov=new_cov), {"crosscov": crosscov}
+
         return self._forward_realization_via_forward_rv(
             realization, t=t, compute_gain=False, _diffusion=_diffusion
         )
@@ -168,17 +195,23 @@ class LinearGaussian(_nonlinear_gaussian.NonlinearGaussian):
     ) -> Tuple[randvars.RandomVariable, typing.Dict]:
         H = self.transition_matrix_fun(t)
         noise = self.noise_fun(t)
-        shift, R = noise.mean, noise.cov
+        shift, R = noise.mean, self._scaled_noise_cov(noise, _diffusion)
 
         new_mean = H @ rv.mean + shift
-        crosscov = rv.cov @ H.T
-        new_cov = H @ crosscov + _diffusion * R
+        crosscov = rv.cov @ self._transposed_transition_matrix(H)
+
+        new_cov = H @ crosscov
+        if isinstance(new_cov, np.ndarray) and isinstance(R, np.ndarray):
+            # Add the noise in place to avoid allocating another temporary
+            new_cov += R
+        else:
+            new_cov = new_cov + R
         info = {"crosscov": crosscov}
         if compute_gain:
             if config.matrix_free:
                 gain = crosscov @ new_cov.inv()
             else:
-                gain = scipy.linalg.solve(new_cov.T, crosscov.T, assume_a="sym").T
+                gain = _solve_gain(crosscov, new_cov)
             info["gain"] = gain
         return randvars.Normal(new_mean, cov=new_cov), info
 
@@ -195,12 +228,13 @@ class LinearGaussian(_nonlinear_gaussian.NonlinearGaussian):
         noise = self.noise_fun(t)
         shift, SR = noise.mean, noise.cov_cholesky
 
+        if _diffusion != 1.0:
+            SR = np.sqrt(_diffusion) * SR
+
         new_mean = H @ rv.mean + shift
-        new_cov_cholesky = cholesky_update(
-            H @ rv.cov_cholesky, np.sqrt(_diffusion) * SR
-        )
+        new_cov_cholesky = cholesky_update(H @ rv.cov_cholesky, SR)
         new_cov = new_cov_cholesky @ new_cov_cholesky.T
-        crosscov = rv.cov @ H.T
+        crosscov = rv.cov @ self._transposed_transition_matrix(H)
         info = {"crosscov": crosscov}
         if compute_gain:
             info["gain"] = scipy.linalg.cho_solve(
@@ -231,55 +265,62 @@ class LinearGaussian(_nonlinear_gaussian.NonlinearGaussian):
                 "Sqrt-implementation does not work with linops for now."
             )
 
-        # Smoothing updates need the gain, but
-        # filtering updates "compute their own".
-        # Thus, if we are doing smoothing (|cov_obtained|>0) an the gain is not
-        # provided, make an extra prediction to compute the gain.
-        if gain is None:
-            if np.linalg.norm(rv_obtained.cov) > 0:
-                rv_forwarded, info_forwarded = self.forward_rv(
-                    rv, t=t, compute_gain=True, _diffusion=_diffusion
-                )
-                gain = info_forwarded["gain"]
-            else:
-                gain = np.zeros((len(rv.mean), len(rv_obtained.mean)))
-
         state_trans = self.transition_matrix_fun(t)
         noise = self.noise_fun(t)
         shift = noise.mean
-        proc_noise_chol = np.sqrt(_diffusion) * noise.cov_cholesky
+        proc_noise_chol = noise.cov_cholesky
+        if _diffusion != 1.0:
+            proc_noise_chol = np.sqrt(_diffusion) * proc_noise_chol
 
+        forwarded_mean = state_trans @ rv.mean + shift
         chol_past = rv.cov_cholesky
-        chol_obtained = rv_obtained.cov_cholesky
+
+        # Filtering updates condition on an exactly obtained value (|cov_obtained|=0),
+        # smoothing updates additionally account for its uncertainty
+        is_smoothing_update = np.linalg.norm(rv_obtained.cov) > 0
 
         output_dim = self.output_dim
         input_dim = self.input_dim
 
-        zeros_bottomleft = np.zeros((output_dim, output_dim))
-        zeros_middleright = np.zeros((output_dim, input_dim))
-
-        blockmat = np.block(
-            [
-                [chol_past.T @ state_trans.T, chol_past.T],
-                [proc_noise_chol.T, zeros_middleright],
-                [zeros_bottomleft, chol_obtained.T @ gain.T],
-            ]
+        # The R-factor of this block matrix contains the Cholesky factor of the
+        # forwarded covariance (top left), the gain (solving with the top row),
+        # and the Cholesky factor of the conditional covariance (bottom right).
+        # Assigning into a preallocated array is much cheaper than np.block
+        blockmat = np.zeros((input_dim + output_dim, output_dim + input_dim))
+        blockmat[:input_dim, :output_dim] = chol_past.T @ (
+            self._transposed_transition_matrix(state_trans)
         )
+        blockmat[:input_dim, output_dim:] = chol_past.T
+        blockmat[input_dim:, :output_dim] = proc_noise_chol.T
         big_triu = np.linalg.qr(blockmat, mode="r")
+        R1 = big_triu[:output_dim, :output_dim]
         new_chol_triu = big_triu[
             output_dim : (output_dim + input_dim), output_dim : (output_dim + input_dim)
         ]
 
-        # If no initial gain was provided, compute it from the QR-results
-        # This is required in the Kalman update, where, other than in the smoothing
-        # update, no initial gain was provided.
-        # Recall that above, gain was set to zero in this setting.
-        if np.linalg.norm(gain) == 0.0:
-            R1 = big_triu[:output_dim, :output_dim]
+        # Smoothing updates need the gain, but filtering updates "compute their own".
+        # In both cases, it can be read off the QR-results, which spares an extra
+        # prediction.
+        if gain is None:
             R12 = big_triu[:output_dim, output_dim:]
             gain = scipy.linalg.solve_triangular(R1, R12, lower=False).T
 
-        new_mean = rv.mean + gain @ (rv_obtained.mean - state_trans @ rv.mean - shift)
+            if rv_forwarded is None and is_smoothing_update:
+                forwarded_cov_cholesky = tril_to_positive_tril(R1.T)
+                rv_forwarded = randvars.Normal(
+                    forwarded_mean,
+                    cov=forwarded_cov_cholesky @ forwarded_cov_cholesky.T,
+                    cov_cholesky=forwarded_cov_cholesky,
+                )
+
+        if is_smoothing_update:
+            chol_obtained = rv_obtained.cov_cholesky
+            new_chol_triu = np.linalg.qr(
+                np.concatenate((new_chol_triu, chol_obtained.T @ gain.T), axis=0),
+                mode="r",
+            )
+
+        new_mean = rv.mean + gain @ (rv_obtained.mean - forwarded_mean)
         new_cov_cholesky = tril_to_positive_tril(new_chol_triu.T)
         new_cov = new_cov_cholesky @ new_cov_cholesky.T
 
@@ -297,23 +338,43 @@ class LinearGaussian(_nonlinear_gaussian.NonlinearGaussian):
     ) -> Tuple[randvars.RandomVariable, typing.Dict]:
         # forwarded_rv is ignored in Joseph updates.
 
+        H = self.transition_matrix_fun(t)
+        noise = self.noise_fun(t)
+        shift, R = noise.mean, noise.cov
+        if _diffusion != 1.0:
+            R = _diffusion * R
+
         if gain is None:
             rv_forwarded, info_forwarded = self.forward_rv(
                 rv, t=t, compute_gain=True, _diffusion=_diffusion
             )
             gain = info_forwarded["gain"]
 
-        H = self.transition_matrix_fun(t)
-        noise = self.noise_fun(t)
-        shift, R = noise.mean, _diffusion * noise.cov
+            # The prediction already contains the forwarded mean
+            forwarded_mean = rv_forwarded.mean
+        else:
+            forwarded_mean = H @ rv.mean + shift
 
-        new_mean = rv.mean + gain @ (rv_obtained.mean - H @ rv.mean - shift)
+        new_mean = rv.mean + gain @ (rv_obtained.mean - forwarded_mean)
         joseph_factor = np.eye(len(rv.mean)) - gain @ H
+        # Both noise terms enter through the gain, so share the quadratic form
         new_cov = (
             joseph_factor @ rv.cov @ joseph_factor.T
-            + gain @ R @ gain.T
-            + gain @ rv_obtained.cov @ gain.T
+            + gain @ (R + rv_obtained.cov) @ gain.T
         )
 
         info = {"rv_forwarded": rv_forwarded}
         return randvars.Normal(new_mean, new_cov), info
+
+
+def _solve_gain(crosscov: np.ndarray, cov: np.ndarray) -> np.ndarray:
+    """Compute the gain ``crosscov @ inv(cov)`` for a symmetric ``cov``.
+
+    A Cholesky solve is cheapest, but requires ``cov`` to be numerically positive
+    definite. Otherwise, fall back to a general symmetric solve.
+    """
+    try:
+        cov_cho_factor = scipy.linalg.cho_factor(cov, lower=True)
+    except np.linalg.LinAlgError:
+        return scipy.linalg.solve(cov.T, crosscov.T, assume_a="sym").T
+    return scipy.linalg.cho_solve(cov_cho_factor, crosscov.T).T
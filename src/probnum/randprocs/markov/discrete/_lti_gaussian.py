@@ -1,5 +1,6 @@
 """Discrete, linear, time-invariant Gaussian transitions."""
 
+import numpy as np
 
 from probnum import randvars
 from probnum.randprocs.markov.discrete import _linear_gaussian
@@ -53,6 +54,13 @@ class LTIGaussian(_linear_gaussian.LinearGaussian):
         self._transition_matrix = transition_matrix
         self._noise = noise
 
+        # Products with the transposed transition matrix are faster if it is stored
+        # contiguously, which pays off since it is constant
+        if isinstance(transition_matrix, np.ndarray):
+            self._transition_matrix_T = np.ascontiguousarray(transition_matrix.T)
+        else:
+            self._transition_matrix_T = transition_matrix.T
+
     @property
     def transition_matrix(self) -> LinearOperatorLike:
         return self._transition_matrix
@@ -61,6 +69,13 @@ class LTIGaussian(_linear_gaussian.LinearGaussian):
     def noise(self) -> randvars.RandomVariable:
         return self._noise
 
+    def _transposed_transition_matrix(
+        self, transition_matrix: LinearOperatorLike
+    ) -> LinearOperatorLike:
+        if transition_matrix is self._transition_matrix:
+            return self._transition_matrix_T
+        return super()._transposed_transition_matrix(transition_matrix)
+
     @classmethod
     def from_linop(
         cls,
@@ -8,6 +8,32 @@ from probnum.randprocs.markov.integrator import _preconditioner
 __all__ = ["IntegratorTransition"]
 
 
+def identity_kronecker(num_blocks: int, B: np.ndarray) -> np.ndarray:
+    r"""Dense Kronecker product :math:`I_n \otimes B` of an identity and a matrix.
+
+    Equivalent to ``np.kron(np.eye(num_blocks), B)``, but writes the blocks directly
+    into the diagonal of a zero array instead of multiplying with :math:`n^2` blocks.
+
+    Parameters
+    ----------
+    num_blocks
+        Number of diagonal blocks :math:`n`.
+    B
+        Block on the diagonal. Must be two-dimensional.
+
+    Returns
+    -------
+    np.ndarray, shape=(num_blocks*B.shape[0], num_blocks*B.shape[1])
+        Block-diagonal matrix with ``num_blocks`` copies of ``B`` on its diagonal.
+    """
+    B = np.asarray(B)
+    nrows, ncols = B.shape
+    blocks = np.zeros((num_blocks, nrows, num_blocks, ncols), dtype=B.dtype)
+    idcs = np.arange(num_blocks)
+    blocks[idcs, :, idcs, :] = B
+    return blocks.reshape(num_blocks * nrows, num_blocks * ncols)
+
+
 class IntegratorTransition:
     r"""Transitions for integrator processes.
 
@@ -63,14 +89,19 @@ class IntegratorTransition:
         np.ndarray, shape=(d, d*(q+1))
             Projection matrix :math:`H_i`.
         """
-        projvec1d = np.eye(self.num_derivatives + 1)[:, coord]
-        projmat1d = projvec1d.reshape((1, self.num_derivatives + 1))
         if config.matrix_free:
+            projvec1d = np.eye(self.num_derivatives + 1)[:, coord]
+            projmat1d = projvec1d.reshape((1, self.num_derivatives + 1))
             return linops.Kronecker(
                 linops.Identity(self.wiener_process_dimension), projmat1d
             )
 
-        return np.kron(np.eye(self.wiener_process_dimension), projmat1d)
+        # Only a single entry per row is nonzero, so write it directly
+        dim, num_coords = self.wiener_process_dimension, self.num_derivatives + 1
+        state_indices = np.arange(dim * num_coords).reshape(dim, num_coords)
+        projmat = np.zeros((dim, dim * num_coords))
+        projmat[np.arange(dim), state_indices[:, coord]] = 1.0
+        return projmat
 
     @property
     def _derivwise2coordwise_projmat(self) -> np.ndarray:
@@ -146,16 +146,20 @@ class IntegratedOrnsteinUhlenbeckTransition(
     def _drift_matrix_ioup(self):
         drift_matrix_1d = np.diag(np.ones(self.num_derivatives), 1)
         drift_matrix_1d[-1, -1] = -self.driftspeed
-        return np.kron(np.eye(self.wiener_process_dimension), drift_matrix_1d)
+        return _integrator.identity_kronecker(
+            self.wiener_process_dimension, drift_matrix_1d
+        )
 
     def _force_vector_ioup(self):
         force_1d = np.zeros(self.num_derivatives + 1)
-        return np.kron(np.ones(self.wiener_process_dimension), force_1d)
+        return np.tile(force_1d, self.wiener_process_dimension)
 
     def _dispersion_matrix_ioup(self):
         dispersion_matrix_1d = np.zeros(self.num_derivatives + 1)
         dispersion_matrix_1d[-1] = 1.0  # Unit Diffusion
-        return np.kron(np.eye(self.wiener_process_dimension), dispersion_matrix_1d).T
+        return _integrator.identity_kronecker(
+            self.wiener_process_dimension, dispersion_matrix_1d.reshape(-1, 1)
+        )
 
     def forward_rv(
         self,
@@ -175,7 +179,9 @@ class IntegratedOrnsteinUhlenbeckTransition(
         rv = _preconditioner.apply_precon(self.precon.inverse(dt), rv)
 
         # Apply preconditioning to system matrices
-        new_drift_matrix = self.precon.inverse(dt) @ self.drift_matrix @ self.precon(dt)
+        new_drift_matrix = _preconditioner.precondition_matrix(
+            self.precon.inverse(dt), self.drift_matrix, self.precon(dt)
+        )
         new_force_vector = self.precon.inverse(dt) @ self.force_vector
         new_dispersion_matrix = self.precon.inverse(dt) @ self.dispersion_matrix
         new_lti_sde = continuous.LTISDE(
@@ -194,9 +200,13 @@ class IntegratedOrnsteinUhlenbeckTransition(
 
         # Undo preconditioning and return
         rv = _preconditioner.apply_precon(self.precon(dt), rv)
-        info["crosscov"] = self.precon(dt) @ info["crosscov"] @ self.precon(dt).T
+        info["crosscov"] = _preconditioner.precondition_matrix(
+            self.precon(dt), info["crosscov"], self.precon(dt)
+        )
         if "gain" in info:
-            info["gain"] = self.precon(dt) @ info["gain"] @ self.precon.inverse(dt).T
+            info["gain"] = _preconditioner.precondition_matrix(
+                self.precon(dt), info["gain"], self.precon.inverse(dt)
+            )
 
         return rv, info
 
@@ -225,13 +235,17 @@ class IntegratedOrnsteinUhlenbeckTransition(
             else None
         )
         gain = (
-            self.precon.inverse(dt) @ gain @ self.precon.inverse(dt).T
+            _preconditioner.precondition_matrix(
+                self.precon.inverse(dt), gain, self.precon.inverse(dt)
+            )
             if gain is not None
             else None
         )
 
         # Apply preconditioning to system matrices
-        new_drift_matrix = self.precon.inverse(dt) @ self.drift_matrix @ self.precon(dt)
+        new_drift_matrix = _preconditioner.precondition_matrix(
+            self.precon.inverse(dt), self.drift_matrix, self.precon(dt)
+        )
         new_force_vector = self.precon.inverse(dt) @ self.force_vector
         new_dispersion_matrix = self.precon.inverse(dt) @ self.dispersion_matrix
         new_lti_sde = continuous.LTISDE(
@@ -146,7 +146,9 @@ class IntegratedWienerTransition(_integrator.IntegratorTransition, continuous.LT
                 num_blocks=self.wiener_process_dimension,
                 B=drift_matrix_1d,
             )
-        return np.kron(np.eye(self.wiener_process_dimension), drift_matrix_1d)
+        return _integrator.identity_kronecker(
+            self.wiener_process_dimension, drift_matrix_1d
+        )
 
     def _force_vector_iwp(self):
         return np.zeros((self.wiener_process_dimension * (self.num_derivatives + 1)))
@@ -160,7 +162,9 @@ class IntegratedWienerTransition(_integrator.IntegratorTransition, continuous.LT
                 num_blocks=self.wiener_process_dimension,
                 B=dispersion_matrix_1d.reshape(-1, 1),
             )
-        return np.kron(np.eye(self.wiener_process_dimension), dispersion_matrix_1d).T
+        return _integrator.identity_kronecker(
+            self.wiener_process_dimension, dispersion_matrix_1d.reshape(-1, 1)
+        )
 
     @cached_property
     def equivalent_discretisation_preconditioned(self):
@@ -181,8 +185,8 @@ class IntegratedWienerTransition(_integrator.IntegratorTransition, continuous.LT
                 num_blocks=self.wiener_process_dimension, B=state_transition_1d
             )
         else:
-            state_transition = np.kron(
-                np.eye(self.wiener_process_dimension), state_transition_1d
+            state_transition = _integrator.identity_kronecker(
+                self.wiener_process_dimension, state_transition_1d
             )
         noise_1d = np.flip(scipy.linalg.hilbert(self.num_derivatives + 1))
         if config.matrix_free:
@@ -190,7 +194,9 @@ class IntegratedWienerTransition(_integrator.IntegratorTransition, continuous.LT
                 num_blocks=self.wiener_process_dimension, B=noise_1d
             )
         else:
-            noise = np.kron(np.eye(self.wiener_process_dimension), noise_1d)
+            noise = _integrator.identity_kronecker(
+                self.wiener_process_dimension, noise_1d
+            )
         empty_shift = np.zeros(
             self.wiener_process_dimension * (self.num_derivatives + 1)
         )
@@ -201,8 +207,8 @@ class IntegratedWienerTransition(_integrator.IntegratorTransition, continuous.LT
                 num_blocks=self.wiener_process_dimension, B=noise_cholesky_1d
             )
         else:
-            noise_cholesky = np.kron(
-                np.eye(self.wiener_process_dimension), noise_cholesky_1d
+            noise_cholesky = _integrator.identity_kronecker(
+                self.wiener_process_dimension, noise_cholesky_1d
             )
 
         return discrete.LTIGaussian(
@@ -233,9 +239,13 @@ class IntegratedWienerTransition(_integrator.IntegratorTransition, continuous.LT
             rv, t, compute_gain=compute_gain, _diffusion=_diffusion
         )
 
-        info["crosscov"] = self.precon(dt) @ info["crosscov"] @ self.precon(dt).T
+        info["crosscov"] = _preconditioner.precondition_matrix(
+            self.precon(dt), info["crosscov"], self.precon(dt)
+        )
         if "gain" in info:
-            info["gain"] = self.precon(dt) @ info["gain"] @ self.precon.inverse(dt).T
+            info["gain"] = _preconditioner.precondition_matrix(
+                self.precon(dt), info["gain"], self.precon.inverse(dt)
+            )
 
         return _preconditioner.apply_precon(self.precon(dt), rv), info
 
@@ -263,7 +273,9 @@ class IntegratedWienerTransition(_integrator.IntegratorTransition, continuous.LT
             else None
         )
         gain = (
-            self.precon.inverse(dt) @ gain @ self.precon.inverse(dt).T
+            _preconditioner.precondition_matrix(
+                self.precon.inverse(dt), gain, self.precon.inverse(dt)
+            )
             if gain is not None
             else None
         )
@@ -286,15 +298,15 @@ class IntegratedWienerTransition(_integrator.IntegratorTransition, continuous.LT
         user's convenience and to maintain a clean interface. Not used for forward_rv,
         etc..
         """
-        transition_matrix = (
-            self.precon(dt)
-            @ self.equivalent_discretisation_preconditioned.transition_matrix
-            @ self.precon.inverse(dt)
+        transition_matrix = _preconditioner.precondition_matrix(
+            self.precon(dt),
+            self.equivalent_discretisation_preconditioned.transition_matrix,
+            self.precon.inverse(dt),
         )
-        proc_noise_cov_mat = (
-            self.precon(dt)
-            @ self.equivalent_discretisation_preconditioned.noise.cov
-            @ self.precon(dt).T
+        proc_noise_cov_mat = _preconditioner.precondition_matrix(
+            self.precon(dt),
+            self.equivalent_discretisation_preconditioned.noise.cov,
+            self.precon(dt),
         )
         zero_shift = np.zeros(transition_matrix.shape[0])
 
@@ -146,19 +146,22 @@ class MaternTransition(_integrator.IntegratorTransition, continuous.LTISDE):
         drift_matrix = np.diag(np.ones(self.num_derivatives), 1)
         nu = self.num_derivatives + 0.5
         D, lam = self.num_derivatives + 1, np.sqrt(2 * nu) / self.lengthscale
-        drift_matrix[-1, :] = np.array(
-            [-scipy.special.binom(D, i) * lam ** (D - i) for i in range(D)]
+        i = np.arange(D)
+        drift_matrix[-1, :] = -scipy.special.binom(D, i) * lam ** (D - i)
+        return _integrator.identity_kronecker(
+            self.wiener_process_dimension, drift_matrix
         )
-        return np.kron(np.eye(self.wiener_process_dimension), drift_matrix)
 
     def _force_vector_matern(self):
         force_1d = np.zeros(self.num_derivatives + 1)
-        return np.kron(np.ones(self.wiener_process_dimension), force_1d)
+        return np.tile(force_1d, self.wiener_process_dimension)
 
     def _dispersion_matrix_matern(self):
         dispersion_matrix_1d = np.zeros(self.num_derivatives + 1)
         dispersion_matrix_1d[-1] = 1.0  # Unit diffusion
-        return np.kron(np.eye(self.wiener_process_dimension), dispersion_matrix_1d).T
+        return _integrator.identity_kronecker(
+            self.wiener_process_dimension, dispersion_matrix_1d.reshape(-1, 1)
+        )
 
     def forward_rv(
         self,
@@ -178,7 +181,9 @@ class MaternTransition(_integrator.IntegratorTransition, continuous.LTISDE):
         rv = _preconditioner.apply_precon(self.precon.inverse(dt), rv)
 
         # Apply preconditioning to system matrices
-        new_drift_matrix = self.precon.inverse(dt) @ self.drift_matrix @ self.precon(dt)
+        new_drift_matrix = _preconditioner.precondition_matrix(
+            self.precon.inverse(dt), self.drift_matrix, self.precon(dt)
+        )
         new_force_vector = self.precon.inverse(dt) @ self.force_vector
         new_dispersion_matrix = self.precon.inverse(dt) @ self.dispersion_matrix
         new_lti_sde = continuous.LTISDE(
@@ -197,9 +202,13 @@ class MaternTransition(_integrator.IntegratorTransition, continuous.LTISDE):
 
         # Undo preconditioning and return
         rv = _preconditioner.apply_precon(self.precon(dt), rv)
-        info["crosscov"] = self.precon(dt) @ info["crosscov"] @ self.precon(dt).T
+        info["crosscov"] = _preconditioner.precondition_matrix(
+            self.precon(dt), info["crosscov"], self.precon(dt)
+        )
         if "gain" in info:
-            info["gain"] = self.precon(dt) @ info["gain"] @ self.precon.inverse(dt).T
+            info["gain"] = _preconditioner.precondition_matrix(
+                self.precon(dt), info["gain"], self.precon.inverse(dt)
+            )
 
         return rv, info
 
@@ -228,13 +237,17 @@ class MaternTransition(_integrator.IntegratorTransition, continuous.LTISDE):
             else None
         )
         gain = (
-            self.precon.inverse(dt) @ gain @ self.precon.inverse(dt).T
+            _preconditioner.precondition_matrix(
+                self.precon.inverse(dt), gain, self.precon.inverse(dt)
+            )
             if gain is not None
             else None
         )
 
         # Apply preconditioning to system matrices
-        new_drift_matrix = self.precon.inverse(dt) @ self.drift_matrix @ self.precon(dt)
+        new_drift_matrix = _preconditioner.precondition_matrix(
+            self.precon.inverse(dt), self.drift_matrix, self.precon(dt)
+        )
         new_force_vector = self.precon.inverse(dt) @ self.force_vector
         new_dispersion_matrix = self.precon.inverse(dt) @ self.dispersion_matrix
         new_lti_sde = continuous.LTISDE(
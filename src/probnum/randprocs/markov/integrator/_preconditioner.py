@@ -22,13 +22,34 @@ def apply_precon(precon, rv):
     # See Issues #319 and #329.
     # When they are resolved, this function here will hopefully be superfluous.
 
-    new_mean = precon @ rv.mean
-    new_cov_cholesky = precon @ rv.cov_cholesky  # precon is diagonal, so this is valid
-    new_cov = new_cov_cholesky @ new_cov_cholesky.T
+    if isinstance(precon, np.ndarray):
+        # Multiplying with a diagonal matrix only scales rows (or columns)
+        scales = np.diagonal(precon)
+        new_mean = scales * rv.mean
+        new_cov_cholesky = scales[:, None] * rv.cov_cholesky
+        new_cov = scales[:, None] * rv.cov * scales[None, :]
+    else:
+        new_mean = precon @ rv.mean
+        new_cov_cholesky = precon @ rv.cov_cholesky  # precon is diagonal
+        new_cov = new_cov_cholesky @ new_cov_cholesky.T
 
     return randvars.Normal(new_mean, new_cov, cov_cholesky=new_cov_cholesky)
 
 
+def precondition_matrix(precon_left, matrix, precon_right):
+    """Compute ``precon_left @ matrix @ precon_right.T`` for diagonal preconditioners.
+
+    Like :func:`apply_precon`, public but not exposed to the 'randprocs' namespace.
+    """
+    if isinstance(precon_left, np.ndarray) and isinstance(precon_right, np.ndarray):
+        return (
+            np.diagonal(precon_left)[:, None]
+            * matrix
+            * np.diagonal(precon_right)[None, :]
+        )
+    return precon_left @ matrix @ precon_right.T
+
+
 class Preconditioner(abc.ABC):
     """Coordinate change transformations as preconditioners in state space models.
 
@@ -79,7 +100,7 @@ class NordsieckLikeCoordinates(Preconditioner):
             return linops.IdentityKronecker(
                 num_blocks=self.dimension, B=linops.Scaling(factors=scaling_vector)
             )
-        return np.kron(np.eye(self.dimension), np.diag(scaling_vector))
+        return np.diag(np.tile(scaling_vector, self.dimension))
 
     @cached_property
     def inverse(self) -> "NordsieckLikeCoordinates":
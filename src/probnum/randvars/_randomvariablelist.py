@@ -32,6 +32,38 @@ class _RandomVariableList(list):
                 )
         super().__init__(rv_list)
 
+    @classmethod
+    def _from_constant_array(cls, support: np.ndarray) -> "_RandomVariableList":
+        """Create a list of constant random variables, one per row of ``support``.
+
+        The stacked statistics of the list are known in advance, so they are not
+        recomputed from the individual random variables on first access.
+        """
+        # Copy, so that the list does not change with the caller's array
+        support = np.array(support)
+        support.setflags(write=False)
+        rv_list = cls([randvars.Constant(row) for row in support])
+
+        mean = support.astype(np.promote_types(support.dtype, np.float_), copy=False)
+        mean.setflags(write=False)
+        var = np.zeros_like(mean)
+        var.setflags(write=False)
+        std = np.zeros_like(mean)
+        std.setflags(write=False)
+        rv_list._seed_cached_properties(
+            mean=mean, mode=support, support=support, var=var, std=std
+        )
+        return rv_list
+
+    def _seed_cached_properties(self, **values: np.ndarray) -> None:
+        """Set the values of cached properties without computing them."""
+        # `functools.cached_property` looks up the instance `__dict__` under the
+        # property's name before calling the getter, and stores its result there.
+        for name, value in values.items():
+            if not isinstance(getattr(type(self), name, None), cached_property):
+                raise AttributeError(f"'{name}' is not a cached property.")
+            self.__dict__[name] = value
+
     def __getitem__(self, idx) -> Union[randvars.RandomVariable, "_RandomVariableList"]:
 
         result = super().__getitem__(idx)
@@ -5,7 +5,7 @@ from typing import Sequence, Union
 import numpy as np
 import scipy.sparse
 
-import probnum.randvars
+import probnum  # `probnum.randvars` is resolved lazily to avoid a cyclic import
 from probnum.typing import ArrayLike
 
 
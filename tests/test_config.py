@@ -51,3 +51,35 @@ def test_register():
     # ... nor by accessing the attribute directly.
     with pytest.raises(AttributeError):
         probnum.config.unknown_config = False
+
+
+def test_context_restores_values_on_exception():
+    default_val = probnum.config.covariance_inversion_damping
+
+    with pytest.raises(RuntimeError):
+        with probnum.config(covariance_inversion_damping=1e-2):
+            raise RuntimeError()
+
+    assert probnum.config.covariance_inversion_damping == default_val
+
+
+def test_context_with_unknown_option_changes_nothing():
+    default_val = probnum.config.covariance_inversion_damping
+
+    with pytest.raises(AttributeError):
+        with probnum.config(covariance_inversion_damping=1e-2, unknown_config=False):
+            pass
+
+    assert probnum.config.covariance_inversion_damping == default_val
+
+
+def test_nested_contexts():
+    default_val = probnum.config.covariance_inversion_damping
+
+    with probnum.config(covariance_inversion_damping=1e-2):
+        with probnum.config(covariance_inversion_damping=1e-3):
+            assert probnum.config.covariance_inversion_damping == 1e-3
+
+        assert probnum.config.covariance_inversion_damping == 1e-2
+
+    assert probnum.config.covariance_inversion_damping == default_val
@@ -34,6 +34,54 @@ class TestODEResidual(_information_operator_test_inferface.ODEInformationOperato
         assert isinstance(called, np.ndarray)
         assert called.shape == (self.info_op.output_dim, self.info_op.input_dim)
 
+    def test_call_and_jacobian_match_projection_matrices(self, fitzhughnagumo):
+        self.info_op.incorporate_ode(ode=fitzhughnagumo)
+        h0, h1 = self.info_op.projection_matrices
+        t, x = fitzhughnagumo.t0, self.initial_rv.mean
+
+        expected_call = h1 @ x - fitzhughnagumo.f(t, h0 @ x)
+        expected_jacobian = h1 - fitzhughnagumo.df(t, h0 @ x) @ h0
+        np.testing.assert_allclose(self.info_op(t, x), expected_call)
+        np.testing.assert_allclose(self.info_op.jacobian(t, x), expected_jacobian)
+
+    def test_projection_matrices_are_shared(self, fitzhughnagumo):
+        other_info_op = diffeq.odefilter.information_operators.ODEResidual(
+            num_prior_derivatives=self.info_op.num_prior_derivatives,
+            ode_dimension=self.info_op.ode_dimension,
+        )
+        self.info_op.incorporate_ode(ode=fitzhughnagumo)
+        other_info_op.incorporate_ode(ode=fitzhughnagumo)
+
+        for h, other_h in zip(
+            self.info_op.projection_matrices, other_info_op.projection_matrices
+        ):
+            assert h is other_h
+            assert not h.flags.writeable
+
+    def test_repeated_evaluations_reuse_ode_evaluations(self, fitzhughnagumo):
+        self.info_op.incorporate_ode(ode=fitzhughnagumo)
+        calls = {"f": 0, "df": 0}
+
+        def counted(name, fun):
+            def wrapped(t, y):
+                calls[name] += 1
+                return fun(t, y)
+
+            return wrapped
+
+        fitzhughnagumo.f = counted("f", fitzhughnagumo.f)
+        fitzhughnagumo.df = counted("df", fitzhughnagumo.df)
+        t, x = fitzhughnagumo.t0, self.initial_rv.mean
+
+        for _ in range(3):
+            self.info_op(t, x)
+            self.info_op.jacobian(t, x)
+        assert calls == {"f": 1, "df": 1}
+
+        self.info_op(t, x + 1.0)
+        self.info_op(t + 1.0, x + 1.0)
+        assert calls["f"] == 3
+
     def test_as_transition(self, fitzhughnagumo):
         # Nothin happens unless an ODE has been incorporated
         with pytest.raises(ValueError):
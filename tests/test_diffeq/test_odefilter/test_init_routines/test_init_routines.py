@@ -1,11 +1,15 @@
 """Tests for initialization routines."""
 
+import subprocess
+import sys
 
 import numpy as np
 import pytest
 import pytest_cases
 
-from probnum import randprocs
+from probnum import problems, randprocs
+from probnum.diffeq.odefilter import init_routines
+from probnum.diffeq.odefilter.init_routines import _autodiff
 
 try:
     from jax.config import config  # speed...
@@ -66,6 +70,49 @@ def test_compare_to_reference_values_is_not_exact_numpy(
     assert np.linalg.norm(dy0_approximated.std) > 0.0
 
 
+@only_if_jax_available
+@pytest_cases.parametrize_with_cases("ivp, dy0_true", prefix="problem_", has_tag="jax")
+@pytest_cases.parametrize_with_cases(
+    "routine", prefix="solver_", has_tag=("is_exact", "requires_jax")
+)
+def test_repeated_calls_reuse_compiled_derivatives(ivp, dy0_true, routine):
+    dy0_first, _ = _compute_approximation(ivp, 2, routine)
+    dy0_second, _ = _compute_approximation(ivp, 2, routine)
+
+    assert routine._compiled_derivatives.cache_info().currsize == 1
+    np.testing.assert_allclose(dy0_first.mean, dy0_second.mean)
+
+    # The zero covariance is shared, so it must not be writeable
+    assert dy0_first.cov is dy0_second.cov
+    assert not dy0_first.cov.flags.writeable
+
+
+@only_if_jax_available
+def test_taylor_mode_non_autonomous_ivp():
+    import jax.numpy as jnp  # pylint: disable=import-outside-toplevel
+
+    ivp = problems.InitialValueProblem(
+        f=lambda t, y: jnp.sin(t) * y**2, t0=0.5, tmax=1.0, y0=np.array([1.0, 2.0])
+    )
+
+    dy0_taylor, _ = _compute_approximation(ivp, 4, init_routines.TaylorMode())
+    dy0_jvp, _ = _compute_approximation(ivp, 4, init_routines.ForwardModeJVP())
+    np.testing.assert_allclose(dy0_taylor.mean, dy0_jvp.mean)
+
+
+@only_if_jax_available
+def test_reverse_mode_computes_jacobian_vector_product():
+    # Non-symmetric Jacobian, such that J v and J^T v differ
+    def fun(x):
+        return np.array([[1.0, 2.0], [3.0, 4.0]]) @ x + x**2
+
+    x, v = np.array([0.5, -1.0]), np.array([1.0, 2.0])
+    jacobian = np.array([[1.0 + 2 * x[0], 2.0], [3.0, 4.0 + 2 * x[1]]])
+
+    jvp = init_routines.ReverseMode()._jvp_or_vjp(fun=fun, primals=x, tangents=v)
+    np.testing.assert_allclose(jvp, jacobian @ v)
+
+
 def _select_derivatives(*, dy0, n):
     return dy0[:n].reshape((-1,), order="F")
 
@@ -80,3 +127,28 @@ def _compute_approximation(ivp, num_derivatives, routine):
     )
     dy0_approximated = routine(ivp=ivp, prior_process=prior_process)
     return dy0_approximated, prior_process
+
+
+def test_importing_diffeq_does_not_import_jax():
+    code = "import sys; import probnum.diffeq; assert 'jax' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@only_if_jax_available
+def test_jax_global_config_is_not_modified():
+    code = (
+        "import jax; from probnum.diffeq.odefilter import init_routines; "
+        "init_routines.TaylorMode(); assert not jax.config.jax_enable_x64"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_missing_jax_raises_import_error(monkeypatch):
+    monkeypatch.setitem(sys.modules, "jax", None)
+    _autodiff._import_jax.cache_clear()
+
+    try:
+        with pytest.raises(ImportError):
+            init_routines.TaylorMode()
+    finally:
+        _autodiff._import_jax.cache_clear()
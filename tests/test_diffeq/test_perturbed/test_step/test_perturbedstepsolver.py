@@ -106,6 +106,14 @@ def test_solve(solvers):
     assert isinstance(solution, diffeq.ODESolution)
 
 
+def test_solve_records_one_scale_per_step(solvers):
+    _, perturbedstepsolver, ode = solvers
+    solution = perturbedstepsolver.solve(ode)
+    assert isinstance(perturbedstepsolver.scales, np.ndarray)
+    assert perturbedstepsolver.scales.shape == (len(solution.locations) - 1,)
+    np.testing.assert_array_equal(solution.scales, perturbedstepsolver.scales)
+
+
 def test_rvlist_to_odesol(solvers, times, list_of_randvars, dense_output):
     _, perturbedstepsolver, ode = solvers
     perturbedstepsolver.interpolants = dense_output
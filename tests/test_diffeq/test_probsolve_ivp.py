@@ -106,3 +106,29 @@ def test_non_adaptive_mode(ivp):
 
     with pytest.raises(ValueError):
         probsolve_ivp(f, t0, tmax, y0, adaptive=False)
+
+
+def test_many_steps_solution_grid(ivp):
+    """Solves with more steps than initially fit into the buffer of the time grid."""
+    sol = probsolve_ivp(
+        ivp.f, ivp.t0, ivp.tmax, ivp.y0, adaptive=False, step=ivp.tmax / 600
+    )
+
+    assert len(sol.locations) == len(sol.states) == 601
+    np.testing.assert_allclose(sol.locations, np.linspace(ivp.t0, ivp.tmax, 601))
+
+
+@pytest.mark.parametrize("time_stops", [[0.15, 0.16], [0.16, 0.15], np.array([0.1])])
+def test_solution_steps_through_time_stops(ivp, time_stops):
+    sol = probsolve_ivp(
+        ivp.f,
+        ivp.t0,
+        ivp.tmax,
+        ivp.y0,
+        adaptive=False,
+        step=0.03,
+        time_stops=time_stops,
+    )
+
+    for time_stop in time_stops:
+        assert np.any(np.isclose(sol.locations, time_stop))
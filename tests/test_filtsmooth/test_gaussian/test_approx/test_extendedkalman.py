@@ -1,8 +1,9 @@
 """Tests for extended Kalman filtering."""
 
+import numpy as np
 import pytest
 
-from probnum import filtsmooth
+from probnum import filtsmooth, randprocs, randvars
 
 from ._linearization_test_interface import (
     InterfaceContinuousLinearizationTest,
@@ -18,6 +19,27 @@ class TestDiscreteEKFComponent(InterfaceDiscreteLinearizationTest):
     def _setup(self):
         self.linearizing_component = filtsmooth.gaussian.approx.DiscreteEKFComponent
 
+    def test_forward_rv_evaluates_jacobian_once(self):
+        num_jacobian_evaluations = 0
+
+        def transition_fun_jacobian(t, x):
+            nonlocal num_jacobian_evaluations
+            num_jacobian_evaluations += 1
+            return np.diag(np.cos(x))
+
+        non_linear_model = randprocs.markov.discrete.NonlinearGaussian(
+            input_dim=2,
+            output_dim=2,
+            transition_fun=lambda t, x: np.sin(x),
+            noise_fun=lambda t: randvars.Normal(np.zeros(2), np.eye(2)),
+            transition_fun_jacobian=transition_fun_jacobian,
+        )
+        rv = randvars.Normal(np.ones(2), np.eye(2))
+        linearised_model = self.linearizing_component(non_linear_model)
+
+        linearised_model.forward_rv(rv, 0.0)
+        assert num_jacobian_evaluations == 1
+
 
 class TestContinuousEKFComponent(InterfaceContinuousLinearizationTest):
 
@@ -0,0 +1,88 @@
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+import probnum
+
+SUBPACKAGES = [
+    "diffeq",
+    "filtsmooth",
+    "functions",
+    "linalg",
+    "linops",
+    "problems",
+    "quad",
+    "randprocs",
+    "randvars",
+    "typing",
+    "utils",
+]
+
+
+def _run_in_fresh_interpreter(code: str, **env):
+    subprocess.run(
+        [sys.executable, "-c", code], env=dict(os.environ, **env), check=True
+    )
+
+
+def test_import_does_not_import_scipy():
+    _run_in_fresh_interpreter(
+        "import sys; import probnum; assert 'scipy' not in sys.modules"
+    )
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "config",
+        "ProbabilisticNumericalMethod",
+        "StoppingCriterion",
+        "LambdaStoppingCriterion",
+    ],
+)
+def test_lightweight_attributes_do_not_import_numpy_or_scipy(name):
+    _run_in_fresh_interpreter(
+        f"import sys; from probnum import {name}; "
+        "assert 'numpy' not in sys.modules and 'scipy' not in sys.modules"
+    )
+
+
+@pytest.mark.parametrize("name", SUBPACKAGES)
+def test_subpackage_import_in_fresh_interpreter(name):
+    _run_in_fresh_interpreter(f"import probnum.{name}")
+
+
+@pytest.mark.parametrize("name", SUBPACKAGES)
+def test_lazy_subpackage_is_module(name):
+    assert getattr(probnum, name) is importlib.import_module(f"probnum.{name}")
+    assert name in dir(probnum)
+
+
+@pytest.mark.parametrize("name", probnum.__all__)
+def test_public_attributes_resolve(name):
+    assert getattr(probnum, name) is not None
+    assert name in dir(probnum)
+
+
+def test_missing_attribute_raises():
+    with pytest.raises(AttributeError):
+        probnum.this_attribute_does_not_exist  # pylint: disable=pointless-statement
+
+
+@pytest.mark.parametrize("value", ["1", "true"])
+def test_sphinx_build_imports_eagerly(value):
+    _run_in_fresh_interpreter(
+        "import sys; import probnum; assert 'probnum.diffeq' in sys.modules",
+        SPHINX_BUILD=value,
+    )
+
+
+@pytest.mark.parametrize("value", ["", "0", "false"])
+def test_no_eager_import_without_sphinx_build(value):
+    _run_in_fresh_interpreter(
+        "import sys; import probnum; assert 'probnum.diffeq' not in sys.modules",
+        SPHINX_BUILD=value,
+    )
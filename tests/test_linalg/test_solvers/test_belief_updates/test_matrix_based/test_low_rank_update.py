@@ -0,0 +1,65 @@
+"""Tests for the lazy low-rank updates of the matrix-based belief updates."""
+
+import numpy as np
+import pytest
+
+from probnum import linops
+from probnum.linalg.solvers.belief_updates.matrix_based._low_rank_update import (
+    low_rank_update,
+)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(42)
+
+
+@pytest.fixture
+def updates(rng):
+    """Base matrix and a sequence of factors of rank-one and rank-two updates."""
+    return rng.standard_normal((5, 5)), [
+        (rng.standard_normal(5), rng.standard_normal(5)),
+        (rng.standard_normal((5, 2)), rng.standard_normal((5, 2))),
+        (rng.standard_normal(5), rng.standard_normal(5)),
+    ]
+
+
+@pytest.fixture
+def updated_linop(updates):
+    base, factors = updates
+    op = linops.Identity(5) @ base
+    for U, V in factors:
+        op = low_rank_update(op, U, V)
+    return op
+
+
+@pytest.fixture
+def updated_matrix(updates):
+    base, factors = updates
+    for U, V in factors:
+        base = base + U.reshape(5, -1) @ V.reshape(5, -1).T
+    return base
+
+
+def test_updates_are_accumulated(updated_linop):
+    assert updated_linop.U.shape == (5, 4)
+    assert updated_linop.V.shape == (5, 4)
+
+
+def test_todense(updated_linop, updated_matrix):
+    np.testing.assert_allclose(updated_linop.todense(), updated_matrix)
+
+
+def test_matmul(updated_linop, updated_matrix, rng):
+    x = rng.standard_normal((3, 5, 2))
+    np.testing.assert_allclose(updated_linop @ x, updated_matrix @ x)
+    np.testing.assert_allclose(updated_linop @ x[0, :, 0], updated_matrix @ x[0, :, 0])
+
+
+def test_transpose(updated_linop, updated_matrix):
+    np.testing.assert_allclose(updated_linop.T.todense(), updated_matrix.T)
+
+
+def test_trace_and_diagonal(updated_linop, updated_matrix):
+    np.testing.assert_allclose(updated_linop.trace(), np.trace(updated_matrix))
+    np.testing.assert_allclose(updated_linop.diagonal(), np.diagonal(updated_matrix))
@@ -111,3 +111,26 @@ def test_against_naive_implementation(
             "Covariance of matrix inverse estimate does not match naive implementation."
         ),
     )
+
+
+@parametrize_with_cases(
+    "belief_update", cases=cases_belief_updates, glob="matrix_based_linear*"
+)
+@parametrize_with_cases(
+    "state",
+    cases=cases_states,
+    has_tag=["has_action", "has_observation", "matrix_based"],
+)
+def test_zero_action_leaves_belief_unchanged(
+    belief_update: belief_updates.matrix_based.MatrixBasedLinearBeliefUpdate,
+    state: LinearSolverState,
+):
+    """Check that the belief is returned as is if the action carries no information."""
+    zero_state = LinearSolverState(problem=state.problem, prior=state.belief)
+    zero_state.action = np.zeros_like(state.action)
+    zero_state.observation = np.zeros_like(state.observation)
+
+    updated_belief = belief_update(solver_state=zero_state)
+
+    assert updated_belief.A is state.belief.A
+    assert updated_belief.Ainv is state.belief.Ainv
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 import probnum.problems.zoo.diffeq as diffeq_zoo
@@ -49,6 +52,17 @@ def test_ddf(ivp_jax):
     ivp_jax.ddf(ivp_jax.t0, ivp_jax.y0)
 
 
+@only_if_jax_available
+def test_single_precision_warns_without_changing_jax_config():
+    code = (
+        "import jax, pytest; import probnum.problems.zoo.diffeq as diffeq_zoo\n"
+        "with pytest.warns(UserWarning, match='single precision'):\n"
+        "    diffeq_zoo.vanderpol_jax()\n"
+        "assert not jax.config.jax_enable_x64"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 # Tests for when JAX is not available
 
 
@@ -0,0 +1,35 @@
+"""Test cases for the polynomial covariance function."""
+
+import numpy as np
+import pytest
+
+from probnum.randprocs import covfuncs
+
+
+@pytest.mark.parametrize("exponent", [1, 2, 3, 4.0, 7, 16, 17, 2.5])
+def test_matrix_equals_power_of_inner_products(exponent):
+    """Check that the polynomial covariance matrix matches the exponentiated linear
+    covariance matrix for integral and non-integral exponents."""
+    rng = np.random.default_rng(42)
+    xs = rng.uniform(size=(10, 3))
+
+    k = covfuncs.Polynomial(input_shape=3, constant=0.5, exponent=exponent)
+    k_lin = covfuncs.Linear(input_shape=3, constant=0.5)
+
+    np.testing.assert_allclose(k.matrix(xs), k_lin.matrix(xs) ** exponent)
+    np.testing.assert_allclose(k(xs, xs), k_lin(xs, xs) ** exponent)
+
+
+@pytest.mark.parametrize("block_size", [1, 8 * 7 * 3, 2**20])
+def test_blocked_matrix_evaluation(block_size, monkeypatch):
+    """Check that evaluating the covariance matrix in blocks of rows, which need not
+    divide the number of inputs, yields the full matrix."""
+    monkeypatch.setattr(covfuncs._polynomial, "_BLOCK_SIZE", block_size)
+
+    rng = np.random.default_rng(1)
+    xs0 = rng.uniform(size=(10, 2))
+    xs1 = rng.uniform(size=(7, 2))
+
+    k = covfuncs.Polynomial(input_shape=2, constant=1.0, exponent=4)
+
+    np.testing.assert_allclose(k.matrix(xs0, xs1), (xs0 @ xs1.T + 1.0) ** 4)
@@ -0,0 +1,29 @@
+"""Test cases for the white noise covariance function."""
+
+import numpy as np
+import pytest
+
+from probnum.randprocs import covfuncs
+
+
+@pytest.mark.parametrize("x1_fn", [lambda x0: None, lambda x0: x0, np.copy])
+def test_identical_integer_inputs(x1_fn):
+    """Check that the noise level is not truncated to the dtype of integer inputs,
+    independent of how identical inputs are passed."""
+    k = covfuncs.WhiteNoise(input_shape=(), sigma_sq=0.5)
+    xs = np.arange(3)
+
+    np.testing.assert_array_equal(k(xs, x1_fn(xs)), np.full(3, 0.5))
+
+
+def test_single_precision_inputs():
+    """Check that the covariance matrix follows the precision of the inputs."""
+    k = covfuncs.WhiteNoise(input_shape=2, sigma_sq=0.5)
+    xs = np.array([[0.0, 1.0], [2.0, 3.0], [0.0, 1.0]], dtype=np.float32)
+
+    k_xs = k.matrix(xs)
+
+    assert k_xs.dtype == np.float32
+    np.testing.assert_array_equal(
+        k_xs, [[0.5, 0.0, 0.5], [0.0, 0.5, 0.0], [0.5, 0.0, 0.5]]
+    )
@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from probnum import randprocs, randvars
+from probnum import linops, randprocs, randvars
 from tests.test_randprocs.test_markov.test_continuous import test_sde
 
 
@@ -149,6 +149,30 @@ def test_solve_mde_forward_values(ltisde_as_linearsde, ltisde, v_const, diffusio
     np.testing.assert_allclose(out_linear.cov, out_lti.cov)
 
 
+def test_solve_mde_forward_values_linop_drift(
+    ltisde_as_linearsde, G_const, v_const, L_const, diffusion
+):
+    """Drift matrices given as linear operators yield the same MDE solution."""
+    linop_linearsde = randprocs.markov.continuous.LinearSDE(
+        state_dimension=G_const.shape[0],
+        wiener_process_dimension=L_const.shape[1],
+        drift_matrix_function=lambda t: linops.aslinop(G_const),
+        force_vector_function=lambda t: v_const,
+        dispersion_matrix_function=lambda t: L_const,
+        mde_atol=1e-12,
+        mde_rtol=1e-12,
+    )
+    out_linop, _ = linop_linearsde.forward_realization(
+        v_const, t=0.0, dt=0.1, _diffusion=diffusion
+    )
+    out_dense, _ = ltisde_as_linearsde.forward_realization(
+        v_const, t=0.0, dt=0.1, _diffusion=diffusion
+    )
+
+    np.testing.assert_allclose(out_linop.mean, out_dense.mean)
+    np.testing.assert_allclose(out_linop.cov, out_dense.cov)
+
+
 def test_solve_mde_forward_sqrt_values(
     ltisde_as_linearsde,
     ltisde_as_linearsde_sqrt_forward_implementation,
@@ -1,7 +1,9 @@
 import numpy as np
 import pytest
+import scipy.integrate
+import scipy.linalg
 
-from probnum import randprocs, randvars
+from probnum import linops, randprocs, randvars
 from tests.test_randprocs.test_markov.test_continuous import test_linear_sde
 
 
@@ -43,6 +45,15 @@ class TestLTISDE(test_linear_sde.TestLinearSDE):
         out = self.transition.discretise(dt=0.1)
         assert isinstance(out, randprocs.markov.discrete.LTIGaussian)
 
+    def test_discretise_shift(self):
+        dt = 0.1
+        out = self.transition.discretise(dt=dt)
+        drift_matrix = linops.aslinop(self.G_const).todense()
+        shift_expected, _ = scipy.integrate.quad_vec(
+            lambda s: scipy.linalg.expm(drift_matrix * s) @ self.v_const, 0.0, dt
+        )
+        np.testing.assert_allclose(out.noise.mean, shift_expected)
+
     def test_backward_rv(self, some_normal_rv1, some_normal_rv2):
         out, _ = self.transition.backward_rv(
             some_normal_rv1, some_normal_rv2, t=0.0, dt=0.1
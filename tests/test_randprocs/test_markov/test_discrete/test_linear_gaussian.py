@@ -97,6 +97,35 @@ class TestLinearGaussian(test_nonlinear_gaussian.TestNonlinearGaussian):
         np.testing.assert_allclose(info_classic["crosscov"], info_sqrt["crosscov"])
         np.testing.assert_allclose(info_classic["gain"], info_sqrt["gain"])
 
+    def test_forward_realization_same_as_forward_rv(self, some_normal_rv1, diffusion):
+        """Assert the realization shortcut agrees with forwarding a constant."""
+        out, info = self.transition.forward_realization(
+            some_normal_rv1.mean, 0.0, _diffusion=diffusion
+        )
+        out_rv, info_rv = self.transition.forward_rv(
+            randvars.Constant(some_normal_rv1.mean), 0.0, _diffusion=diffusion
+        )
+
+        np.testing.assert_allclose(out.mean, out_rv.mean)
+        np.testing.assert_allclose(out.cov, out_rv.cov)
+        np.testing.assert_allclose(info["crosscov"], info_rv["crosscov"])
+
+    def test_forward_realization_same_as_via_forward_rv(
+        self, some_normal_rv1, diffusion
+    ):
+        """Assert the realization shortcut agrees with the general implementation."""
+        out, info = self.transition.forward_realization(
+            some_normal_rv1.mean, 0.0, _diffusion=diffusion
+        )
+        out_rv, info_rv = self.transition._forward_realization_via_forward_rv(
+            some_normal_rv1.mean, t=0.0, _diffusion=diffusion
+        )
+
+        np.testing.assert_allclose(out.mean, out_rv.mean)
+        np.testing.assert_allclose(out.cov, out_rv.cov)
+        np.testing.assert_allclose(info["crosscov"], info_rv["crosscov"])
+        assert info["crosscov"].flags.writeable
+
     def test_all_backward_rv_same_no_cache(
         self, some_normal_rv1, some_normal_rv2, diffusion
     ):
@@ -121,6 +150,20 @@ class TestLinearGaussian(test_nonlinear_gaussian.TestNonlinearGaussian):
         np.testing.assert_allclose(out_joseph.mean, out_sqrt.mean)
         np.testing.assert_allclose(out_joseph.cov, out_sqrt.cov)
 
+    def test_backward_rv_sqrt_forwarded_rv(
+        self, some_normal_rv1, some_normal_rv2, diffusion
+    ):
+        """Without a gain, the sqrt-smoothing step reads the forwarded RV off its QR
+        decomposition, which must match an explicit prediction."""
+        _, info = self.transition._backward_rv_sqrt(
+            some_normal_rv1, some_normal_rv2, t=0.0, _diffusion=diffusion
+        )
+        rv_forwarded, _ = self.transition._forward_rv_classic(
+            some_normal_rv2, t=0.0, _diffusion=diffusion
+        )
+        np.testing.assert_allclose(info["rv_forwarded"].mean, rv_forwarded.mean)
+        np.testing.assert_allclose(info["rv_forwarded"].cov, rv_forwarded.cov)
+
     def test_all_backward_rv_same_with_cache(
         self, some_normal_rv1, some_normal_rv2, diffusion
     ):
@@ -352,3 +395,16 @@ class TestLinearGaussianLinOps:
                 some_normal_rv1.mean, linop_cov_rv
             )
             assert isinstance(out, randvars.Normal)
+
+
+def test_classic_gain_without_positive_definite_forward_cov():
+    """The gain is also computable if the forwarded covariance is indefinite."""
+    transition = randprocs.markov.discrete.LinearGaussian(
+        input_dim=2,
+        output_dim=2,
+        transition_matrix_fun=lambda t: np.eye(2),
+        noise_fun=lambda t: randvars.Normal(np.zeros(2), np.diag([0.0, -2.0])),
+    )
+    rv = randvars.Normal(np.zeros(2), np.eye(2))
+    _, info = transition.forward_rv(rv, 0.0, compute_gain=True)
+    np.testing.assert_allclose(info["gain"], np.diag([1.0, -1.0]))
@@ -115,3 +115,24 @@ def test_same_backward_outputs(both_transitions, diffusion, rng):
     )
     np.testing.assert_allclose(out_1.mean, out_2.mean)
     np.testing.assert_allclose(out_1.cov, out_2.cov)
+
+
+@pytest.mark.parametrize("num_blocks", [1, 3])
+@pytest.mark.parametrize("block_shape", [(4, 4), (1, 4), (4, 1)])
+def test_identity_kronecker_equals_kron(num_blocks, block_shape):
+    B = np.random.default_rng(42).standard_normal(block_shape)
+    np.testing.assert_array_equal(
+        randprocs.markov.integrator._integrator.identity_kronecker(num_blocks, B),
+        np.kron(np.eye(num_blocks), B),
+    )
+
+
+@pytest.mark.parametrize("coord", [0, 2, -1])
+def test_proj2coord_multidimensional(coord):
+    integrator = randprocs.markov.integrator.IntegratorTransition(
+        num_derivatives=2, wiener_process_dimension=3
+    )
+    projmat1d = np.eye(3)[coord].reshape(1, -1)
+    np.testing.assert_array_equal(
+        integrator.proj2coord(coord=coord), np.kron(np.eye(3), projmat1d)
+    )
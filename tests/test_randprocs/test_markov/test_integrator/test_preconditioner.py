@@ -1,7 +1,8 @@
 import numpy as np
 import pytest
 
-from probnum import randprocs
+from probnum import randprocs, randvars
+from probnum.randprocs.markov.integrator import _preconditioner
 
 
 @pytest.fixture
@@ -22,3 +23,26 @@ def test_inverse(precon):
     P, Pinv = precon(0.5), precon.inverse(0.5)
     np.testing.assert_allclose(P @ Pinv, np.eye(*P.shape))
     np.testing.assert_allclose(Pinv @ P, np.eye(*P.shape))
+
+
+def test_apply_precon(precon):
+    P = precon(0.5)
+    rng = np.random.default_rng(42)
+    cov_cholesky = np.tril(rng.uniform(0.5, 1.0, size=P.shape))
+    rv = randvars.Normal(
+        rng.standard_normal(len(P)),
+        cov_cholesky @ cov_cholesky.T,
+        cov_cholesky=cov_cholesky,
+    )
+    rv_precon = _preconditioner.apply_precon(P, rv)
+    np.testing.assert_allclose(rv_precon.mean, P @ rv.mean)
+    np.testing.assert_allclose(rv_precon.cov, P @ rv.cov @ P.T)
+    np.testing.assert_allclose(rv_precon.cov_cholesky, P @ rv.cov_cholesky)
+
+
+def test_precondition_matrix(precon):
+    P, Pinv = precon(0.5), precon.inverse(0.5)
+    matrix = np.random.default_rng(42).standard_normal(P.shape)
+    np.testing.assert_allclose(
+        _preconditioner.precondition_matrix(P, matrix, Pinv), P @ matrix @ Pinv.T
+    )
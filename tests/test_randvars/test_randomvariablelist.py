@@ -50,6 +50,43 @@ class TestRandomVariableList(unittest.TestCase):
         self.assertEqual(self.rv_list.shape, (2,))
 
 
+class TestRandomVariableListFromConstantArray(unittest.TestCase):
+    def setUp(self):
+        self.support = np.arange(6).reshape((3, 2))
+        self.rv_list = _RandomVariableList._from_constant_array(self.support)
+        self.rv_list_elementwise = _RandomVariableList(
+            [Constant(row) for row in self.support]
+        )
+
+    def test_elements(self):
+        self.assertEqual(len(self.rv_list), 3)
+        for rv, row in zip(self.rv_list, self.support):
+            self.assertIsInstance(rv, Constant)
+            np.testing.assert_array_equal(rv.support, row)
+
+    def test_statistics_match_elementwise_construction(self):
+        for attr in ["mean", "mode", "support", "var", "std"]:
+            with self.subTest(attr=attr):
+                expected = getattr(self.rv_list_elementwise, attr)
+                actual = getattr(self.rv_list, attr)
+                self.assertEqual(actual.dtype, expected.dtype)
+                np.testing.assert_array_equal(actual, expected)
+
+    def test_statistics_read_only(self):
+        for attr in ["mean", "mode", "support", "var", "std"]:
+            with self.subTest(attr=attr):
+                with self.assertRaises(ValueError):
+                    getattr(self.rv_list, attr)[0, 0] = 1
+
+    def test_independent_of_input_array(self):
+        self.support[0, 0] = 100
+        self.assertEqual(self.rv_list.mean[0, 0], 0)
+        self.assertEqual(self.rv_list.support[0, 0], 0)
+
+    def test_var_and_std_not_shared(self):
+        self.assertFalse(np.shares_memory(self.rv_list.var, self.rv_list.std))
+
+
 class TestEmptyRandomVariableList(unittest.TestCase):
     """Passing an empty list does not screw things up."""
 